@@ -1,40 +1,94 @@
 #!/usr/bin/env python3
-"""Convert PNG icon to Windows ICO format."""
+"""Convert PNG icon to Windows ICO format.
 
+The resampling passes run noticeably faster with Pillow-SIMD, an API-compatible
+Pillow build with SSE4/AVX2 convolution kernels:
+
+    pip uninstall -y pillow && pip install pillow-simd
+"""
+
+import PIL
 from PIL import Image
+import io
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# zlib level for the embedded PNGs: level 1 encodes several times faster than
+# Pillow's default (6) and costs only a few percent in size on icon-sized images
+PNG_COMPRESS_LEVEL = 1
+
+
+def build_ico(icons, compress_level=PNG_COMPRESS_LEVEL):
+    """Return ICO file bytes embedding each image as a PNG-compressed entry.
+
+    Each image is PNG-encoded exactly once; the ICONDIR/ICONDIRENTRY headers
+    are written by hand (a 256 px dimension is stored as 0 per the format).
+    """
+    encoded = []
+    for icon in icons:
+        buf = io.BytesIO()
+        icon.save(buf, format="PNG", optimize=False, compress_level=compress_level)
+        encoded.append(buf.getvalue())
+
+    header = struct.pack("<HHH", 0, 1, len(encoded))
+    offset = len(header) + 16 * len(encoded)
+    entries = []
+    for icon, data in zip(icons, encoded):
+        width, height = icon.size
+        entries.append(
+            struct.pack("<BBBBHHII", width & 0xFF, height & 0xFF, 0, 0, 1, 32, len(data), offset)
+        )
+        offset += len(data)
+    return header + b"".join(entries) + b"".join(encoded)
+
+
 def main():
     # Get project root
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     assets_dir = project_root / "assets"
     
+    # Pillow-SIMD publishes versions with a ".postN" suffix
+    backend = "Pillow-SIMD" if "post" in PIL.__version__ else "Pillow"
+    print(f"Using {backend} {PIL.__version__}")
+
     # Open the source image
     img = Image.open(assets_dir / "icon.png")
     
-    # Convert to RGBA if necessary
-    if img.mode != "RGBA":
+    # Convert to RGBA if necessary (RGB only needs an opaque alpha band added)
+    if img.mode == "RGB":
+        img.putalpha(255)
+    elif img.mode != "RGBA":
         img = img.convert("RGBA")
     
     # Define sizes for Windows ICO (standard sizes)
     sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
     
-    # Create resized images
-    icons = []
-    for size in sizes:
-        resized = img.resize(size, Image.Resampling.LANCZOS)
-        icons.append(resized)
+    # Create resized images largest first. Only the largest size is filtered
+    # from the full source; the other LANCZOS sizes are independent resizes of
+    # it and run concurrently (Pillow releases the GIL while resampling).
+    # LANCZOS is indistinguishable from an area average at 16/32 px, so those
+    # chain off the smallest LANCZOS size with BOX.
+    ordered = sorted(sizes, reverse=True)
+    largest = img.resize(ordered[0], Image.Resampling.LANCZOS)
+    large = [size for size in ordered[1:] if size[0] >= 48]
+    small = [size for size in ordered[1:] if size[0] < 48]
+    workers = max(1, min(len(large), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        icons = [largest] + list(
+            executor.map(lambda size: largest.resize(size, Image.Resampling.LANCZOS), large)
+        )
+    current = icons[-1]
+    for size in small:
+        current = current.resize(size, Image.Resampling.BOX)
+        icons.append(current)
+    icons.reverse()
     
     # Save as ICO with multiple sizes
     ico_path = assets_dir / "icon.ico"
-    icons[0].save(
-        ico_path,
-        format="ICO",
-        sizes=[(s[0], s[1]) for s in sizes],
-        append_images=icons[1:]
-    )
+    ico_path.write_bytes(build_ico(icons))
     
     print(f"Successfully created {ico_path}")
     print(f"File size: {os.path.getsize(ico_path)} bytes")
@@ -15,6 +15,17 @@ import sys
 from pathlib import Path
 
 
+def wait_until(predicate, timeout_ms: int = 2000, step_ms: int = 20) -> bool:
+    """Process Qt events until ``predicate()`` is true or ``timeout_ms`` elapses."""
+    from PyQt6 import QtTest
+
+    elapsed = 0
+    while not predicate() and elapsed < timeout_ms:
+        QtTest.QTest.qWait(step_ms)
+        elapsed += step_ms
+    return bool(predicate())
+
+
 def main() -> int:
     os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
@@ -45,7 +56,7 @@ def main() -> int:
     # Perform login
     ui.entered_password.setText("password")
     QtTest.QTest.mouseClick(ui.login_buttons, QtCore.Qt.MouseButton.LeftButton)
-    app.processEvents()
+    wait_until(lambda: getattr(ui, "dashboard", None) is not None and ui.dashboard.isVisible())
 
     dashboard = getattr(ui, "dashboard", None)
     failures: list[str] = []
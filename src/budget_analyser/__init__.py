@@ -8,6 +8,18 @@ Goal:
     to run from the composition root.
 """
 
-from budget_analyser.version import __version__, APP_NAME, get_version
+from typing import Any
 
-__all__ = ["__version__", "APP_NAME", "get_version"]
+from budget_analyser.version import APP_NAME, get_version
+
+# `__version__` is served by the module __getattr__ below, which star-imports also use
+__all__ = ["__version__", "APP_NAME", "get_version"]  # pylint: disable=undefined-all-variable
+
+
+def __getattr__(name: str) -> Any:
+    # `__version__` is resolved lazily by the version module (PEP 562)
+    if name == "__version__":
+        from budget_analyser import version  # pylint: disable=import-outside-toplevel
+
+        return version.__version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,11 +6,13 @@ Default behavior:
 
 from __future__ import annotations
 
-from budget_analyser.views.app_gui import run_app as run_gui
-
 
 def main() -> None:
     """Run the PySide6 GUI application by default."""
+    # Imported lazily: the GUI module pulls in Qt, pandas and all infrastructure.
+    # pylint: disable-next=import-outside-toplevel
+    from budget_analyser.views.app_gui import run_app as run_gui
+
     run_gui()
 
 
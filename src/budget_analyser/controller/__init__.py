@@ -12,15 +12,32 @@ Design pattern:
 
 from __future__ import annotations
 
-from .yearly_summary_stats_controller import YearlySummaryStatsController
-from .settings_controller import SettingsController
-from .earnings_stats_controller import EarningsStatsController
-from .expenses_stats_controller import ExpensesStatsController
-from .payments_reconciliation_controller import PaymentsReconciliationController
-from .mapper_controller import MapperController
-from .cashflow_mapper_controller import CashflowMapperController
-from .sub_category_mapper_controller import SubCategoryMapperController
-from .upload_controller import UploadController
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .yearly_summary_stats_controller import YearlySummaryStatsController
+    from .settings_controller import SettingsController
+    from .earnings_stats_controller import EarningsStatsController
+    from .expenses_stats_controller import ExpensesStatsController
+    from .payments_reconciliation_controller import PaymentsReconciliationController
+    from .mapper_controller import MapperController
+    from .cashflow_mapper_controller import CashflowMapperController
+    from .sub_category_mapper_controller import SubCategoryMapperController
+    from .upload_controller import UploadController
+
+# Controller name -> submodule; each is imported on first attribute access (PEP 562)
+_LAZY = {
+    "YearlySummaryStatsController": "yearly_summary_stats_controller",
+    "SettingsController": "settings_controller",
+    "EarningsStatsController": "earnings_stats_controller",
+    "ExpensesStatsController": "expenses_stats_controller",
+    "PaymentsReconciliationController": "payments_reconciliation_controller",
+    "MapperController": "mapper_controller",
+    "CashflowMapperController": "cashflow_mapper_controller",
+    "SubCategoryMapperController": "sub_category_mapper_controller",
+    "UploadController": "upload_controller",
+}
 
 __all__ = [
     "YearlySummaryStatsController",
@@ -33,3 +50,17 @@ __all__ = [
     "SubCategoryMapperController",
     "UploadController",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
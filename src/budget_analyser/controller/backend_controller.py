@@ -7,10 +7,16 @@ Single responsibility:
 from __future__ import annotations
 
 import logging
-from typing import List
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Mapping, Tuple
 import time
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from budget_analyser.domain.protocols import (
     CategoryMappingProvider,
@@ -23,6 +29,92 @@ from budget_analyser.domain.transaction_processing import CategoryMappers, Trans
 from budget_analyser.controller.monthly_reports import MonthlyReports
 
 
+def _fast_concat(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Row-concatenate frames sharing one schema, column by column.
+
+    Builds each output column with a single `np.concatenate` (or
+    `union_categoricals` for categorical columns) instead of letting
+    `pd.concat` rebuild and consolidate blocks. Falls back to `pd.concat`
+    when column names differ or a column uses another extension dtype.
+    A single frame (the common one-account case) is returned without copying.
+    """
+    if len(frames) == 1:
+        frame = frames[0]
+        if frame.index.equals(pd.RangeIndex(len(frame))):
+            return frame
+        return frame.reset_index(drop=True)
+
+    columns = frames[0].columns
+    if any(not frame.columns.equals(columns) for frame in frames[1:]):
+        return pd.concat(frames, ignore_index=True)
+
+    data: dict[str, object] = {}
+    for column in columns:
+        parts = [frame[column] for frame in frames]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            data[column] = union_categoricals(parts)
+        elif all(isinstance(part.dtype, np.dtype) for part in parts):
+            data[column] = np.concatenate([part.to_numpy(copy=False) for part in parts])
+        else:
+            return pd.concat(frames, ignore_index=True)
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+def _preview_keys(mapping: Mapping[str, str] | None, n: int = 5) -> list[str]:
+    """Return up to `n` keys of `mapping` for log output, without a full copy."""
+    return list(islice(mapping, n)) if mapping else []
+
+
+# (month, full month group, earnings source, expenses source)
+_MonthTask = Tuple[pd.Period, pd.DataFrame, pd.DataFrame, pd.DataFrame]
+
+
+def _month_positions(frame: pd.DataFrame) -> list[tuple[pd.Period, np.ndarray]]:
+    """Return `(month, row positions)` pairs for `frame`'s `year_month` column.
+
+    Groups on the int64 period ordinals behind the PeriodArray, so pandas
+    takes its integer groupby path instead of hashing Period objects; the
+    Period label is rebuilt only once per month. Months are yielded
+    chronologically and NaT rows are dropped, as with a Period groupby.
+    """
+    periods = frame["year_month"]
+    ordinals = periods.array.asi8
+    indices = frame.groupby(ordinals, sort=True).indices
+    freq = periods.dtype.freq
+    return [
+        (pd.Period(ordinal=int(ordinal), freq=freq), positions)
+        for ordinal, positions in indices.items()
+        if ordinal != pd.NaT.value
+    ]
+
+
+def _payment_exclusion_masks(frame: pd.DataFrame) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return row masks excluding payment confirmations and payments made.
+
+    The first mask keeps rows that are not `payment_confirmations` (earnings
+    source), the second keeps rows that are not `payments_made` (expenses
+    source). Computed once per frame and sliced per month by position.
+
+    The column is factorized once so each mask is an int comparison against
+    one code rather than a string comparison per row; missing values get the
+    -1 sentinel and so are kept, as with `fillna("")`.
+    Returns None when `sub_category` is absent.
+
+    Raises:
+        TypeError: If `sub_category` holds unhashable values.
+    """
+    if "sub_category" not in frame.columns:
+        return None
+    codes, uniques = pd.factorize(frame["sub_category"])
+    labels = np.asarray(uniques, dtype=object)
+
+    def keep_rows_not(label: str) -> np.ndarray:
+        hits = np.flatnonzero(labels == label)
+        return codes != hits[0] if hits.size else np.ones(len(codes), dtype=bool)
+
+    return keep_rows_not("payment_confirmations"), keep_rows_not("payments_made")
+
+
 class BackendController:  # pylint: disable=too-few-public-methods
     """Controller that runs the backend reporting workflow."""
 
@@ -51,102 +143,53 @@ class BackendController:  # pylint: disable=too-few-public-methods
         self._report_service = report_service
         self._logger = logger
 
-    def run(self) -> List[MonthlyReports]:  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    def run(self) -> List[MonthlyReports]:
         """Execute the workflow and return month-wise report tables.
 
         Returns:
             A list of `MonthlyReports` objects (one per month).
         """
+        return list(self.run_iter())
+
+    def run_iter(self) -> Iterator[MonthlyReports]:
+        """Execute the workflow, yielding month-wise report tables as they are built.
+
+        Lets callers consume and drop each month instead of holding the whole
+        report list; months are yielded chronologically, as `run()` returns them.
+
+        Yields:
+            One `MonthlyReports` object per month.
+        """
         # 1) Load raw statement data.
         t0 = time.perf_counter()
+        debug_on = self._logger.isEnabledFor(logging.DEBUG)
         self._logger.info("Loading statements")
         statements = self._statement_repository.get_statements()
         self._logger.info("Pipeline start: accounts=%d", len(statements))
 
         # 2) Format each statement using account-specific column mapping.
+        # Accounts are independent, so they are formatted concurrently; results
+        # keep the repository's account order.
         formatted_frames: list[pd.DataFrame] = []
-        for account, raw_statement in statements.items():
-            try:
-                # Per-account diagnostics before formatting
-                try:
-                    shape = getattr(raw_statement, "shape", None)
-                    cols = list(getattr(raw_statement, "columns", []))
-                    self._logger.debug(
-                        "Formatting account=%s raw_shape=%s raw_cols=%s",
-                        account,
-                        shape,
-                        cols,
-                    )
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
-
-                # Load mapping and choose a formatter.
-                column_mapping = self._column_mappings.get_column_mapping(account)
-                try:
-                    self._logger.debug(
-                        "Account=%s column_mapping size=%d sample_keys=%s",
-                        account,
-                        len(column_mapping or {}),
-                        list((column_mapping or {}).keys())[:5],
-                    )
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
-
-                formatter = create_statement_formatter(
-                    account_name=account,
-                    statement=raw_statement,
-                    column_mapping=column_mapping,
+        if statements:
+            workers = min(len(statements), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                formatted_frames = list(
+                    executor.map(self._format_statement, statements.keys(), statements.values())
                 )
-                # Normalize to canonical schema.
-                formatted = formatter.get_desired_format()
-                try:
-                    self._logger.debug(
-                        "Formatted account=%s shape=%s cols=%s",
-                        account,
-                        getattr(formatted, "shape", None),
-                        list(getattr(formatted, "columns", [])),
-                    )
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
-                formatted_frames.append(formatted)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # Log rich context and re-raise
-                try:
-                    head_repr = None
-                    try:
-                        head_repr = raw_statement.head(5).to_dict()  # type: ignore[assignment]
-                    except Exception:  # pylint: disable=broad-exception-caught
-                        fallback = getattr(raw_statement, "head", lambda n=5, rs=raw_statement: rs)
-                        head_repr = str(fallback())[:500]
-                    mapping_keys = (
-                        list((column_mapping or {}).keys())[:10]
-                        if 'column_mapping' in locals() else []
-                    )
-                    self._logger.exception(
-                        "Formatting failed for account=%s; cols=%s; mapping_keys=%s; head=%s",
-                        account,
-                        list(getattr(raw_statement, "columns", [])),
-                        mapping_keys,
-                        head_repr,
-                    )
-                except Exception:  # pylint: disable=broad-exception-caught
-                    self._logger.exception("Formatting failed for account=%s", account)
-                raise
 
         # Fast-exit when there is no data.
         if not formatted_frames:
-            return []
+            return
 
         # 3) Merge all formatted statements.
-        transactions = pd.concat(formatted_frames, ignore_index=True)
-        try:
+        transactions = _fast_concat(formatted_frames)
+        if debug_on:
             self._logger.debug(
                 "Merged transactions shape=%s cols=%s",
                 transactions.shape,
                 list(transactions.columns),
             )
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
 
         # 4) Categorize using JSON keyword mappings.
         processor = TransactionProcessor(
@@ -160,56 +203,156 @@ class BackendController:  # pylint: disable=too-few-public-methods
         # 5) Add a month period column for grouping.
         processed["year_month"] = processed["transaction_date"].dt.to_period("M")
 
-        # 6) Build month-wise report tables.
-        reports: list[MonthlyReports] = []
-        for month, group in processed.groupby(processed["year_month"]):
-            self._logger.info("Generating reports for %s", month)
-            # Exclusion rules for standard reports:
-            # - Do not include payment confirmations as earnings
-            # - Do not include payments made as expenses
-            # Keep full group for specialized pages (e.g., reconciliation)
-            try:
-                earn_source = group
-                exp_source = group
-                if "sub_category" in group.columns:
-                    earn_source = group[group["sub_category"].fillna("") != "payment_confirmations"]
-                    exp_source = group[group["sub_category"].fillna("") != "payments_made"]
-                else:
-                    self._logger.debug(
-                        "No sub_category column present for %s; "
-                        "skipping payments exclusions in aggregates",
-                        month,
-                    )
-            except Exception:  # pylint: disable=broad-exception-caught
-                earn_source = group
-                exp_source = group
-
-            reports.append(
-                MonthlyReports(
-                    month=month,
-                    earnings=self._report_service.earnings(statement=earn_source),
-                    expenses=self._report_service.expenses(statement=exp_source),
-                    expenses_category=self._report_service.expenses_category(statement=exp_source),
-                    expenses_sub_category=self._report_service.expenses_sub_category(
-                        statement=exp_source
-                    ),
-                    transactions=group,
+        # 6) Build month-wise report tables, slicing each month only when it is
+        # about to be built.
+        months = 0
+        for report in self._iter_monthly_reports(self._month_tasks(processed)):
+            months += 1
+            yield report
+        # One report per month, so the month count needs no extra scan.
+        self._logger.info(
+            "Pipeline end: transactions=%d months=%d duration=%.2fs",
+            len(processed.index),
+            months,
+            time.perf_counter() - t0,
+        )
+
+    def _format_statement(self, account: str, raw_statement: pd.DataFrame) -> pd.DataFrame:
+        """Format one account's raw statement into the canonical schema.
+
+        Runs on a worker thread from `run()`; failures are logged with context
+        and re-raised. Debug diagnostics are only built when DEBUG is enabled.
+        """
+        debug_on = self._logger.isEnabledFor(logging.DEBUG)
+        column_mapping = None
+        try:
+            # Per-account diagnostics before formatting
+            if debug_on and isinstance(raw_statement, pd.DataFrame):
+                self._logger.debug(
+                    "Formatting account=%s raw_shape=%s raw_cols=%s",
+                    account,
+                    raw_statement.shape,
+                    list(raw_statement.columns),
+                )
+
+            # Load mapping and choose a formatter.
+            column_mapping = self._column_mappings.get_column_mapping(account)
+            if debug_on:
+                self._logger.debug(
+                    "Account=%s column_mapping size=%d sample_keys=%s",
+                    account,
+                    len(column_mapping or ()),
+                    _preview_keys(column_mapping),
                 )
+
+            formatter = create_statement_formatter(
+                account_name=account,
+                statement=raw_statement,
+                column_mapping=column_mapping,
             )
+            # Normalize to canonical schema.
+            formatted = formatter.get_desired_format()
+            if debug_on and isinstance(formatted, pd.DataFrame):
+                self._logger.debug(
+                    "Formatted account=%s shape=%s cols=%s",
+                    account,
+                    formatted.shape,
+                    list(formatted.columns),
+                )
+            return formatted
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Log rich context and re-raise
+            try:
+                head_repr = None
+                try:
+                    head_repr = raw_statement.head(5).to_dict()  # type: ignore[assignment]
+                except Exception:  # pylint: disable=broad-exception-caught
+                    fallback = getattr(raw_statement, "head", lambda n=5, rs=raw_statement: rs)
+                    head_repr = str(fallback())[:500]
+                mapping_keys = _preview_keys(column_mapping, 10)
+                self._logger.exception(
+                    "Formatting failed for account=%s; cols=%s; mapping_keys=%s; head=%s",
+                    account,
+                    list(getattr(raw_statement, "columns", [])),
+                    mapping_keys,
+                    head_repr,
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._logger.exception("Formatting failed for account=%s", account)
+            raise
+
+    def _month_tasks(self, frame: pd.DataFrame) -> Iterator[_MonthTask]:
+        """Yield one report task per month of `frame`, chronologically.
 
-        # Return computed reports.
+        Exclusion rules for standard reports:
+        - Do not include payment confirmations as earnings
+        - Do not include payments made as expenses
+        The full month group is kept for specialized pages (e.g., reconciliation).
+        Month slices are taken lazily, as the tasks are consumed.
+        """
         try:
-            duration = time.perf_counter() - t0
-            months = processed["year_month"].nunique()
-            self._logger.info(
-                "Pipeline end: transactions=%d months=%d duration=%.2fs",
-                len(processed.index),
-                int(months),
-                duration,
+            masks = _payment_exclusion_masks(frame)
+        except TypeError:
+            # Aggregates will include payments, so make this visible
+            self._logger.warning(
+                "Could not factorize sub_category; "
+                "skipping payments exclusions in aggregates",
+                exc_info=True,
             )
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
-        return reports
+            masks = None
+        else:
+            if masks is None:
+                self._logger.debug(
+                    "No sub_category column present; "
+                    "skipping payments exclusions in aggregates"
+                )
+        for month, positions in _month_positions(frame):
+            self._logger.info("Generating reports for %s", month)
+            group = frame.iloc[positions]
+            earn_source = group
+            exp_source = group
+            if masks is not None:
+                earn_source = group[masks[0][positions]]
+                exp_source = group[masks[1][positions]]
+            yield month, group, earn_source, exp_source
+
+    def _iter_monthly_reports(self, tasks: Iterable[_MonthTask]) -> Iterator[MonthlyReports]:
+        """Yield one `MonthlyReports` per task, building months in parallel.
+
+        Months are independent and the report service only reads its
+        configuration, so the per-month aggregations run on a thread pool.
+        At most one task per worker is in flight, and tasks are pulled from
+        `tasks` only as earlier months are yielded, so a slow consumer does not
+        let built months pile up. Reports keep the input (chronological) order.
+        """
+        workers = os.cpu_count() or 1
+        pending_tasks = iter(tasks)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight: Deque[Future[MonthlyReports]] = deque(
+                executor.submit(self._build_monthly_report, task)
+                for task in islice(pending_tasks, workers)
+            )
+            while in_flight:
+                report = in_flight.popleft().result()
+                # Refill before yielding so the pool keeps working while the caller does
+                for task in islice(pending_tasks, 1):
+                    in_flight.append(executor.submit(self._build_monthly_report, task))
+                yield report
+
+    def _build_monthly_report(self, task: _MonthTask) -> MonthlyReports:
+        """Run the report service over one month's earnings/expenses sources."""
+        month, group, earn_source, exp_source = task
+        bundle = self._report_service.build_all(
+            earnings_statement=earn_source, expenses_statement=exp_source
+        )
+        return MonthlyReports(
+            month=month,
+            earnings=bundle.earnings,
+            expenses=bundle.expenses,
+            expenses_category=bundle.expenses_category,
+            expenses_sub_category=bundle.expenses_sub_category,
+            transactions=group,
+        )
 
     def run_from_database(self, processed_transactions: pd.DataFrame) -> List[MonthlyReports]:
         """Generate reports from pre-processed database transactions.
@@ -232,52 +375,23 @@ class BackendController:  # pylint: disable=too-few-public-methods
             self._logger.info("No transactions in database")
             return []
 
-        # Ensure transaction_date is datetime
-        if "transaction_date" in processed_transactions.columns:
-            processed_transactions["transaction_date"] = pd.to_datetime(
-                processed_transactions["transaction_date"], format="mixed", errors="coerce"
-            )
+        # Ensure transaction_date is datetime; typed frames skip the reparse
+        dates = processed_transactions["transaction_date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, format="mixed", errors="coerce")
+            processed_transactions["transaction_date"] = dates
 
         # Add year_month period column for grouping
-        date_col = processed_transactions["transaction_date"]
-        processed_transactions["year_month"] = date_col.dt.to_period("M")
+        processed_transactions["year_month"] = dates.dt.to_period("M")
 
         # Build month-wise report tables (same logic as run())
-        reports: list[MonthlyReports] = []
-        for month, group in processed_transactions.groupby(processed_transactions["year_month"]):
-            self._logger.info("Generating reports for %s", month)
-            try:
-                earn_source = group
-                exp_source = group
-                if "sub_category" in group.columns:
-                    earn_source = group[group["sub_category"].fillna("") != "payment_confirmations"]
-                    exp_source = group[group["sub_category"].fillna("") != "payments_made"]
-            except Exception:  # pylint: disable=broad-exception-caught
-                earn_source = group
-                exp_source = group
-
-            reports.append(
-                MonthlyReports(
-                    month=month,
-                    earnings=self._report_service.earnings(statement=earn_source),
-                    expenses=self._report_service.expenses(statement=exp_source),
-                    expenses_category=self._report_service.expenses_category(statement=exp_source),
-                    expenses_sub_category=self._report_service.expenses_sub_category(
-                        statement=exp_source
-                    ),
-                    transactions=group,
-                )
-            )
+        reports = list(self._iter_monthly_reports(self._month_tasks(processed_transactions)))
 
-        try:
-            duration = time.perf_counter() - t0
-            months = processed_transactions["year_month"].nunique()
-            self._logger.info(
-                "Database pipeline end: transactions=%d months=%d duration=%.2fs",
-                len(processed_transactions.index),
-                int(months),
-                duration,
-            )
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
+        # One report per month, so the month count needs no extra scan.
+        self._logger.info(
+            "Database pipeline end: transactions=%d months=%d duration=%.2fs",
+            len(processed_transactions.index),
+            len(reports),
+            time.perf_counter() - t0,
+        )
         return reports
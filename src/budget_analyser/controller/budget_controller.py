@@ -7,9 +7,13 @@ and recurring transaction detection.
 from __future__ import annotations
 
 import logging
+import re
+from collections import defaultdict
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from budget_analyser.infrastructure.budget_database import (
@@ -21,7 +25,7 @@ from budget_analyser.infrastructure.budget_database import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetProgress:
     """Progress tracking for a budget category."""
 
@@ -33,7 +37,7 @@ class BudgetProgress:
     status: str  # "under", "warning", "over"
 
 
-@dataclass
+@dataclass(slots=True)
 class SavingsMetrics:
     """Savings rate and related metrics."""
 
@@ -45,7 +49,7 @@ class SavingsMetrics:
     months_of_data: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NetWorthSummary:
     """Net worth summary with breakdown."""
 
@@ -57,6 +61,47 @@ class NetWorthSummary:
     accounts: List[Account]
 
 
+# Multiplier converting a recurring amount at each frequency to a monthly amount
+_MONTHLY_FREQUENCY_WEIGHTS: Dict[str, float] = {
+    "weekly": 4.33,
+    "monthly": 1.0,
+    "quarterly": 1 / 3,
+    "yearly": 1 / 12,
+}
+
+
+def _transaction_dates(df: pd.DataFrame) -> pd.Series | None:
+    """Return `transaction_date` parsed as datetimes, or None if there is none."""
+    if df.empty or "transaction_date" not in df.columns:
+        return None
+    return pd.to_datetime(df["transaction_date"], errors="coerce")
+
+
+def _month_period(year_month: str) -> pd.Period | None:
+    """Return the monthly Period for a "YYYY-MM" string, or None if malformed.
+
+    Only the canonical spelling is accepted (e.g. "2025-1" is rejected), so
+    matching is exactly the old `strftime("%Y-%m") == year_month` comparison.
+    """
+    try:
+        period = pd.Period(year_month, freq="M")
+    except (TypeError, ValueError):
+        return None
+    return period if str(period) == year_month else None
+
+
+def _monthly_amount_totals(df: pd.DataFrame, dates: pd.Series | None) -> pd.Series:
+    """Return `amount` summed per calendar month, indexed by monthly Period.
+
+    ``dates`` is ``df``'s parsed `transaction_date` (see `_transaction_dates`).
+    Rows with unparseable dates are dropped; an empty Series is returned when
+    there are no dates.
+    """
+    if dates is None:
+        return pd.Series(dtype=float)
+    return df["amount"].groupby(dates.dt.to_period("M")).sum()
+
+
 class BudgetController:  # pylint: disable=too-many-public-methods
     """Controller for budget management and financial metrics."""
 
@@ -73,12 +118,26 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         """
         self._budget_db = budget_db
         self._logger = logger or logging.getLogger("budget_analyser.budget_controller")
+        # Memoized list reads; every mutator below clears it. This controller
+        # is the only writer of its database, so entries cannot go stale.
+        self._reads: Dict[Tuple[str, tuple], tuple] = {}
+
+    def _cached_read(self, name: str, *args: object) -> tuple:
+        """Return `self._budget_db.<name>(*args)` as a tuple, memoized until a write."""
+        key = (name, args)
+        if key not in self._reads:
+            self._reads[key] = tuple(getattr(self._budget_db, name)(*args))
+        return self._reads[key]
+
+    def _invalidate_reads(self) -> None:
+        self._reads.clear()
 
     # ==================== Budget Goals ====================
 
     def set_budget(self, category: str, monthly_limit: float,
                    year_month: str = "ALL") -> BudgetGoal:
         """Set a budget limit for a category."""
+        self._invalidate_reads()
         return self._budget_db.set_budget_goal(category, monthly_limit, year_month)
 
     def get_budget(self, category: str, year_month: str = "ALL") -> Optional[BudgetGoal]:
@@ -87,10 +146,11 @@ class BudgetController:  # pylint: disable=too-many-public-methods
 
     def get_all_budgets(self) -> List[BudgetGoal]:
         """Get all budget goals."""
-        return self._budget_db.get_all_budget_goals()
+        return list(self._cached_read("get_all_budget_goals"))
 
     def delete_budget(self, category: str, year_month: str = "ALL") -> bool:
         """Delete a budget goal."""
+        self._invalidate_reads()
         return self._budget_db.delete_budget_goal(category, year_month)
 
     # ==================== Earnings Goals ====================
@@ -102,6 +162,7 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         year_month: str = "ALL",
     ) -> EarningsGoal:
         """Set an expected earnings amount for a sub-category."""
+        self._invalidate_reads()
         return self._budget_db.set_earnings_goal(sub_category, expected_amount, year_month)
 
     def get_earnings_goal(
@@ -112,10 +173,11 @@ class BudgetController:  # pylint: disable=too-many-public-methods
 
     def get_all_earnings_goals(self) -> List[EarningsGoal]:
         """Get all earnings goals."""
-        return self._budget_db.get_all_earnings_goals()
+        return list(self._cached_read("get_all_earnings_goals"))
 
     def delete_earnings_goal(self, sub_category: str, year_month: str = "ALL") -> bool:
         """Delete an earnings goal."""
+        self._invalidate_reads()
         return self._budget_db.delete_earnings_goal(sub_category, year_month)
 
     def get_earnings_goal_map(self, year_month: str = "ALL") -> Dict[str, float]:
@@ -127,21 +189,17 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         Returns:
             Dict mapping sub_category name to expected_amount.
         """
-        goals = self._budget_db.get_all_earnings_goals()
-        result: Dict[str, float] = {}
+        defaults: Dict[str, float] = {}
+        overrides: Dict[str, float] = {}
 
-        # First, add all "ALL" goals
-        for goal in goals:
+        # Single pass: "ALL" goals are defaults, month-specific goals override them
+        for goal in self._cached_read("get_all_earnings_goals"):
             if goal.year_month == "ALL":
-                result[goal.sub_category] = goal.expected_amount
-
-        # Then override with month-specific goals if year_month is specified
-        if year_month != "ALL":
-            for goal in goals:
-                if goal.year_month == year_month:
-                    result[goal.sub_category] = goal.expected_amount
+                defaults[goal.sub_category] = goal.expected_amount
+            elif goal.year_month == year_month:
+                overrides[goal.sub_category] = goal.expected_amount
 
-        return result
+        return {**defaults, **overrides}
 
     # pylint: disable=too-many-locals
     def calculate_budget_progress(
@@ -158,28 +216,28 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         Returns:
             List of BudgetProgress for each category with a budget.
         """
-        budgets = self._budget_db.get_all_budget_goals()
+        budgets = self._cached_read("get_all_budget_goals")
         if not budgets:
             return []
 
-        # Filter expenses for the month
-        if expenses_df.empty:
+        # Filter expenses for the month, selecting only the columns used below
+        dates = _transaction_dates(expenses_df)
+        period = _month_period(year_month)
+        if dates is None or period is None:
             month_expenses = pd.DataFrame()
         else:
-            df = expenses_df.copy()
-            if "transaction_date" in df.columns:
-                df["year_month"] = pd.to_datetime(
-                    df["transaction_date"], errors="coerce"
-                ).dt.strftime("%Y-%m")
-                month_expenses = df[df["year_month"] == year_month]
-            else:
-                month_expenses = pd.DataFrame()
+            # Compares int64 period ordinals instead of formatting every date
+            in_month = (dates.dt.to_period("M") == period).to_numpy()
+            columns = [col for col in ("category", "amount") if col in expenses_df.columns]
+            month_expenses = expenses_df.loc[in_month, columns]
 
         # Calculate spending by category
         spending_by_category: Dict[str, float] = {}
         if not month_expenses.empty and "category" in month_expenses.columns:
-            # Expenses are negative, so we negate to get positive values
-            grouped = month_expenses.groupby("category")["amount"].sum()
+            # Expenses are negative, so we negate to get positive values.
+            # Unsorted and observed-only: the totals feed a dict, and a
+            # Categorical column (if the caller passes one) skips empty categories.
+            grouped = month_expenses.groupby("category", observed=True, sort=False)["amount"].sum()
             for cat, amount in grouped.items():
                 spending_by_category[cat] = abs(float(amount))
 
@@ -213,7 +271,7 @@ class BudgetController:  # pylint: disable=too-many-public-methods
             ))
 
         # Sort by percentage descending (most spent first)
-        progress_list.sort(key=lambda p: p.percentage, reverse=True)
+        progress_list.sort(key=attrgetter("percentage"), reverse=True)
         return progress_list
 
     def get_categories_over_budget(
@@ -227,11 +285,26 @@ class BudgetController:  # pylint: disable=too-many-public-methods
 
     # ==================== Savings Rate ====================
 
+    @staticmethod
+    def parse_transaction_dates(df: pd.DataFrame) -> Optional[pd.Series]:
+        """Parse a frame's `transaction_date` column for the savings calculations.
+
+        Callers that pass the same frame to several savings methods can parse it
+        once here and hand the result to each of them.
+
+        Returns:
+            The parsed datetimes (unparseable values become NaT), or None when
+            the frame is empty or has no `transaction_date` column.
+        """
+        return _transaction_dates(df)
+
     def calculate_savings_metrics(
         self,
         earnings_df: pd.DataFrame,
         expenses_df: pd.DataFrame,
-        year: Optional[int] = None
+        year: Optional[int] = None,
+        *,
+        dates: Optional[Tuple[Optional[pd.Series], Optional[pd.Series]]] = None,
     ) -> SavingsMetrics:
         """Calculate savings rate and related metrics.
 
@@ -239,20 +312,25 @@ class BudgetController:  # pylint: disable=too-many-public-methods
             earnings_df: DataFrame with earnings transactions.
             expenses_df: DataFrame with expense transactions.
             year: Optional year to filter by. If None, uses all data.
+            dates: Optional (earnings, expenses) dates from `parse_transaction_dates`.
+                Parsed here when omitted.
 
         Returns:
             SavingsMetrics with savings rate and related data.
         """
+        # Parse each frame's dates once; reused for the year filter and month count
+        if dates is None:
+            dates = (_transaction_dates(earnings_df), _transaction_dates(expenses_df))
+        earnings_dates, expenses_dates = dates
+
         # Filter by year if specified
         if year is not None:
-            if not earnings_df.empty and "transaction_date" in earnings_df.columns:
-                earnings_df = earnings_df[
-                    pd.to_datetime(earnings_df["transaction_date"], errors="coerce").dt.year == year
-                ]
-            if not expenses_df.empty and "transaction_date" in expenses_df.columns:
-                expenses_df = expenses_df[
-                    pd.to_datetime(expenses_df["transaction_date"], errors="coerce").dt.year == year
-                ]
+            if earnings_dates is not None:
+                in_year = (earnings_dates.dt.year == year).to_numpy()
+                earnings_df, earnings_dates = earnings_df[in_year], earnings_dates[in_year]
+            if expenses_dates is not None:
+                in_year = (expenses_dates.dt.year == year).to_numpy()
+                expenses_df, expenses_dates = expenses_df[in_year], expenses_dates[in_year]
 
         # Calculate totals
         total_earnings = float(earnings_df["amount"].sum()) if not earnings_df.empty else 0.0
@@ -268,13 +346,12 @@ class BudgetController:  # pylint: disable=too-many-public-methods
             savings_rate = 0.0
 
         # Calculate months of data
-        months_set = set()
-        for df in [earnings_df, expenses_df]:
-            if not df.empty and "transaction_date" in df.columns:
-                dates = pd.to_datetime(df["transaction_date"], errors="coerce")
-                months_set.update(dates.dt.to_period("M").dropna().unique())
+        months = pd.PeriodIndex([], freq="M")
+        for parsed in (earnings_dates, expenses_dates):
+            if parsed is not None:
+                months = months.union(pd.PeriodIndex(parsed.dt.to_period("M").dropna().unique()))
 
-        months_of_data = len(months_set) if months_set else 1
+        months_of_data = len(months) if len(months) else 1
 
         monthly_average_savings = net_savings / months_of_data if months_of_data > 0 else 0.0
 
@@ -291,7 +368,9 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         self,
         earnings_df: pd.DataFrame,
         expenses_df: pd.DataFrame,
-        year: int
+        year: int,
+        *,
+        dates: Optional[Tuple[Optional[pd.Series], Optional[pd.Series]]] = None,
     ) -> List[Tuple[str, float, float, float, float]]:
         """Calculate savings for each month in a year.
 
@@ -299,6 +378,8 @@ class BudgetController:  # pylint: disable=too-many-public-methods
             earnings_df: DataFrame with earnings transactions.
             expenses_df: DataFrame with expense transactions.
             year: Year to calculate for.
+            dates: Optional (earnings, expenses) dates from `parse_transaction_dates`.
+                Parsed here when omitted.
 
         Returns:
             List of tuples: (month_name, earnings, expenses, savings, savings_rate)
@@ -310,32 +391,19 @@ class BudgetController:  # pylint: disable=too-many-public-methods
 
         results: List[Tuple[str, float, float, float, float]] = []
 
+        # Parse dates and total each frame per month once, then look months up.
+        if dates is None:
+            dates = (_transaction_dates(earnings_df), _transaction_dates(expenses_df))
+        earnings_by_month = _monthly_amount_totals(earnings_df, dates[0])
+        expenses_by_month = _monthly_amount_totals(expenses_df, dates[1])
+        if earnings_by_month.empty and expenses_by_month.empty:
+            return [(name, 0.0, 0.0, 0.0, 0.0) for name in month_names]
+
         for month_idx in range(1, 13):
-            year_month = f"{year}-{month_idx:02d}"
-
-            # Filter earnings for month
-            month_earnings = 0.0
-            if not earnings_df.empty and "transaction_date" in earnings_df.columns:
-                df = earnings_df.copy()
-                df["ym"] = (
-                    pd.to_datetime(df["transaction_date"], errors="coerce")
-                    .dt.strftime("%Y-%m")
-                )
-                month_data = df[df["ym"] == year_month]
-                month_earnings = float(month_data["amount"].sum()) if not month_data.empty else 0.0
-
-            # Filter expenses for month
-            month_expenses = 0.0
-            if not expenses_df.empty and "transaction_date" in expenses_df.columns:
-                df = expenses_df.copy()
-                df["ym"] = (
-                    pd.to_datetime(df["transaction_date"], errors="coerce")
-                    .dt.strftime("%Y-%m")
-                )
-                month_data = df[df["ym"] == year_month]
-                month_expenses = (
-                    abs(float(month_data["amount"].sum())) if not month_data.empty else 0.0
-                )
+            period = pd.Period(year=year, month=month_idx, freq="M")
+            month_earnings = float(earnings_by_month.get(period, 0.0))
+            # Expenses are negative, so we take absolute value
+            month_expenses = abs(float(expenses_by_month.get(period, 0.0)))
 
             savings = month_earnings - month_expenses
             savings_rate = (savings / month_earnings * 100) if month_earnings > 0 else 0.0
@@ -355,39 +423,42 @@ class BudgetController:  # pylint: disable=too-many-public-methods
     def add_account(self, name: str, account_type: str, balance: float = 0,
                     notes: str = "") -> Account:
         """Add a new financial account."""
+        self._invalidate_reads()
         return self._budget_db.add_account(name, account_type, balance, notes)
 
     def update_account_balance(self, account_id: int, balance: float) -> bool:
         """Update an account's balance."""
+        self._invalidate_reads()
         return self._budget_db.update_account_balance(account_id, balance)
 
     def get_all_accounts(self) -> List[Account]:
         """Get all financial accounts."""
-        return self._budget_db.get_all_accounts()
+        return list(self._cached_read("get_all_accounts"))
 
     def delete_account(self, account_id: int) -> bool:
         """Delete a financial account."""
+        self._invalidate_reads()
         return self._budget_db.delete_account(account_id)
 
     def get_net_worth_summary(self) -> NetWorthSummary:
         """Get comprehensive net worth summary."""
-        accounts = self._budget_db.get_all_accounts()
+        accounts = list(self._cached_read("get_all_accounts"))
 
-        assets_by_type: Dict[str, float] = {}
-        liabilities_by_type: Dict[str, float] = {}
+        assets: defaultdict[str, float] = defaultdict(float)
+        liabilities: defaultdict[str, float] = defaultdict(float)
 
         asset_types = {"checking", "savings", "investment", "other"}
         liability_types = {"credit_card", "loan"}
 
         for account in accounts:
             if account.account_type in asset_types:
-                assets_by_type[account.account_type] = (
-                    assets_by_type.get(account.account_type, 0.0) + account.balance
-                )
+                assets[account.account_type] += account.balance
             elif account.account_type in liability_types:
-                liabilities_by_type[account.account_type] = (
-                    liabilities_by_type.get(account.account_type, 0.0) + abs(account.balance)
-                )
+                liabilities[account.account_type] += abs(account.balance)
+
+        # Plain dicts in the summary so lookups of absent types don't insert keys
+        assets_by_type: Dict[str, float] = dict(assets)
+        liabilities_by_type: Dict[str, float] = dict(liabilities)
 
         total_assets = sum(assets_by_type.values())
         total_liabilities = sum(liabilities_by_type.values())
@@ -412,6 +483,7 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         sub_category: str = "",
     ) -> RecurringTransaction:
         """Add a recurring transaction."""
+        self._invalidate_reads()
         return self._budget_db.add_recurring_transaction(
             description, expected_amount, frequency, category, sub_category
         )
@@ -420,14 +492,16 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         self, active_only: bool = True
     ) -> List[RecurringTransaction]:
         """Get all recurring transactions."""
-        return self._budget_db.get_all_recurring_transactions(active_only)
+        return list(self._cached_read("get_all_recurring_transactions", active_only))
 
     def deactivate_recurring_transaction(self, recurring_id: int) -> bool:
         """Mark a recurring transaction as inactive."""
+        self._invalidate_reads()
         return self._budget_db.deactivate_recurring_transaction(recurring_id)
 
     def delete_recurring_transaction(self, recurring_id: int) -> bool:
         """Delete a recurring transaction."""
+        self._invalidate_reads()
         return self._budget_db.delete_recurring_transaction(recurring_id)
 
     def detect_recurring_transactions(
@@ -448,18 +522,13 @@ class BudgetController:  # pylint: disable=too-many-public-methods
             Dictionary with monthly_total, yearly_projection, and count.
         """
         _ = transactions_df
-        recurring = self._budget_db.get_all_recurring_transactions(active_only=True)
+        recurring = self._cached_read("get_all_recurring_transactions", True)
 
-        monthly_total = 0.0
-        for rec in recurring:
-            if rec.frequency == "weekly":
-                monthly_total += abs(rec.expected_amount) * 4.33
-            elif rec.frequency == "monthly":
-                monthly_total += abs(rec.expected_amount)
-            elif rec.frequency == "quarterly":
-                monthly_total += abs(rec.expected_amount) / 3
-            elif rec.frequency == "yearly":
-                monthly_total += abs(rec.expected_amount) / 12
+        # Unknown frequencies contribute nothing
+        monthly_total = sum(
+            abs(rec.expected_amount) * _MONTHLY_FREQUENCY_WEIGHTS.get(rec.frequency, 0.0)
+            for rec in recurring
+        )
 
         return {
             "monthly_total": monthly_total,
@@ -483,28 +552,46 @@ class BudgetController:  # pylint: disable=too-many-public-methods
         Returns:
             List of anomalies with description, expected, actual, and difference.
         """
-        recurring = self._budget_db.get_all_recurring_transactions(active_only=True)
+        recurring = self._cached_read("get_all_recurring_transactions", True)
         if not recurring or transactions_df.empty:
             return []
 
         anomalies = []
 
+        # Descriptions are lowercased once and rules matched as literal text:
+        # rule descriptions are raw bank strings ("SQ *COFFEE", "AMZN (US)")
+        # whose regex metacharacters must not be interpreted.
+        # One scan with the union of all rules narrows the frame to candidate
+        # rows; each rule is then only matched against those candidates.
+        # Sorting once (newest first) makes the first match per rule its most
+        # recent transaction.
+        descriptions = transactions_df["description"].str.lower()
+        union_pattern = "|".join(re.escape(rec.description.lower()) for rec in recurring)
+        is_candidate = descriptions.str.contains(union_pattern, na=False).to_numpy()
+        if not is_candidate.any():
+            return []
+        # Carry the lowercased text along positionally so sorting keeps it aligned
+        candidates = transactions_df[is_candidate].assign(
+            _description_lc=descriptions[is_candidate].to_numpy()
+        )
+        if "transaction_date" in candidates.columns:
+            candidates = candidates.sort_values(
+                "transaction_date", ascending=False, kind="stable"
+            )
+        candidate_descriptions = candidates["_description_lc"]
+        candidate_amounts = candidates["amount"].to_numpy()
+
         for rec in recurring:
             # Find recent transactions matching this recurring item
-            matches = transactions_df[
-                transactions_df["description"].str.contains(
-                    rec.description, case=False, na=False
-                )
-            ]
+            is_match = candidate_descriptions.str.contains(
+                rec.description.lower(), regex=False, na=False
+            ).to_numpy(dtype=bool)
 
-            if matches.empty:
+            if not is_match.any():
                 continue
 
-            # Get the most recent transaction
-            if "transaction_date" in matches.columns:
-                matches = matches.sort_values("transaction_date", ascending=False)
-
-            recent_amount = abs(float(matches.iloc[0]["amount"]))
+            # Candidates are newest first, so the first match is the most recent
+            recent_amount = abs(float(candidate_amounts[np.argmax(is_match)]))
             expected_amount = abs(rec.expected_amount)
 
             # Check if amount differs significantly
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from budget_analyser.domain.errors import DataSourceError
 from budget_analyser.infrastructure.json_mappings import JsonCashflowMappingStore
@@ -26,23 +26,24 @@ class CashflowMapperController:
     """Controller to edit earnings/expenses category grouping.
 
     Keeps an in-memory copy of the cashflow mapping and persists via
-    ``JsonCashflowMappingStore``.
+    ``JsonCashflowMappingStore``. Each flow is held as a tuple and replaced
+    (never mutated) on edits, so queries hand it out without copying.
     """
 
     def __init__(self, store: JsonCashflowMappingStore, logger: logging.Logger):
         self._store = store
         self._logger = logger
-        self._mapping: Dict[str, List[str]] = {"Earnings": [], "Expenses": []}
+        self._mapping: Dict[str, Tuple[str, ...]] = {"Earnings": (), "Expenses": ()}
         self.reload()
 
     # ---- Queries ----
-    def earnings_categories(self) -> List[str]:
-        return list(self._mapping.get("Earnings", []))
+    def earnings_categories(self) -> Tuple[str, ...]:
+        return self._mapping.get("Earnings", ())
 
-    def expense_categories(self) -> List[str]:
-        return list(self._mapping.get("Expenses", []))
+    def expense_categories(self) -> Tuple[str, ...]:
+        return self._mapping.get("Expenses", ())
 
-    def mapping(self) -> Dict[str, List[str]]:
+    def mapping(self) -> Dict[str, Tuple[str, ...]]:
         return {"Earnings": self.earnings_categories(), "Expenses": self.expense_categories()}
 
     # ---- Mutations ----
@@ -51,10 +52,10 @@ class CashflowMapperController:
         exp = _dedup_keep_order(expenses)
 
         # Remove categories that appear in both; favor the last assignment (expenses wins)
-        earn_lower = {c.lower() for c in exp}
-        earn = [c for c in earn if c.lower() not in earn_lower]
+        exp_lower = {c.lower() for c in exp}
+        earn = [c for c in earn if c.lower() not in exp_lower]
 
-        self._mapping = {"Earnings": earn, "Expenses": exp}
+        self._mapping = {"Earnings": tuple(earn), "Expenses": tuple(exp)}
 
     def add_category(self, name: str, flow: str) -> None:
         val = (name or "").strip()
@@ -64,33 +65,35 @@ class CashflowMapperController:
         target = "Expenses" if (flow or "").strip().lower().startswith("exp") else "Earnings"
         other = "Earnings" if target == "Expenses" else "Expenses"
 
-        other_list = [c for c in self._mapping.get(other, []) if c.lower() != val.lower()]
-        target_list = self._mapping.get(target, [])
-        if val.lower() not in {c.lower() for c in target_list}:
-            target_list = target_list + [val]
+        key = val.lower()
+        other_list = tuple(c for c in self._mapping.get(other, ()) if c.lower() != key)
+        target_list = self._mapping.get(target, ())
+        if all(c.lower() != key for c in target_list):
+            target_list = target_list + (val,)
 
         self._mapping[target] = target_list
         self._mapping[other] = other_list
 
     def move_to_earnings(self, categories: Iterable[str]) -> None:
-        current_exp = self._mapping.get("Expenses", [])
-        move_set = {c.lower() for c in categories if str(c).strip()}
-        self._mapping["Expenses"] = [c for c in current_exp if c.lower() not in move_set]
-        self._mapping["Earnings"] = _dedup_keep_order(
-            list(self._mapping.get("Earnings", [])) + [c for c in categories if str(c).strip()]
-        )
+        self._move(categories, source="Expenses", target="Earnings")
 
     def move_to_expenses(self, categories: Iterable[str]) -> None:
-        current_earn = self._mapping.get("Earnings", [])
-        move_set = {c.lower() for c in categories if str(c).strip()}
-        self._mapping["Earnings"] = [c for c in current_earn if c.lower() not in move_set]
-        self._mapping["Expenses"] = _dedup_keep_order(
-            list(self._mapping.get("Expenses", [])) + [c for c in categories if str(c).strip()]
+        self._move(categories, source="Earnings", target="Expenses")
+
+    def _move(self, categories: Iterable[str], *, source: str, target: str) -> None:
+        # Materialize once: `categories` may be a one-shot iterator
+        moving = [c for c in categories if str(c).strip()]
+        move_set = {c.lower() for c in moving}
+        self._mapping[source] = tuple(
+            c for c in self._mapping.get(source, ()) if c.lower() not in move_set
+        )
+        self._mapping[target] = tuple(
+            _dedup_keep_order([*self._mapping.get(target, ()), *moving])
         )
 
     # ---- Persistence ----
     def save(self) -> None:
-        self._store.save_cashflow(self._mapping)
+        self._store.save_cashflow({flow: list(cats) for flow, cats in self._mapping.items()})
         self._logger.info(
             "Cashflow mapping saved: earnings=%d expenses=%d",
             len(self._mapping.get("Earnings", [])),
@@ -108,5 +111,5 @@ class CashflowMapperController:
 
         self.set_mapping(earnings, expenses)
         # Ensure both keys exist even if file is missing sections
-        self._mapping.setdefault("Earnings", [])
-        self._mapping.setdefault("Expenses", [])
+        self._mapping.setdefault("Earnings", ())
+        self._mapping.setdefault("Expenses", ())
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YearlyStats:
     """View-friendly yearly statistics for Home page.
 
@@ -20,7 +20,7 @@ class YearlyStats:
     exp_subcats: List[Tuple[str, float]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryNode:
     """Category -> Sub-categories node used for tree rendering."""
 
@@ -30,7 +30,7 @@ class CategoryNode:
     children: List[Tuple[str, float]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YearlyCategoryBreakdown:
     """Yearly category breakdown for both earnings and expenses.
 
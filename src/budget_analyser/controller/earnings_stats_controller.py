@@ -3,13 +3,21 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from budget_analyser.controller.controllers import MonthlyReports
 from budget_analyser.controller.budget_controller import BudgetController
-from .utils import month_names as _month_names
+from .utils import DatedFrame as _DatedFrame
+from .utils import RowIndex as _RowIndex
+from .utils import dated_frames as _dated_frames
+from .utils import day_number as _day_number
+from .utils import month_label as _month_label
+from .utils import ranked_sub_totals as _ranked_sub_totals
+from .utils import stack_rows as _stack_rows
+from .utils import stack_masked_columns as _stack_masked_columns
 
 
 @dataclass(frozen=True)
@@ -24,6 +32,50 @@ class _YearSummary:
     months: List[Tuple[pd.Period, float, List[Tuple[str, float]]]]  # (period, total, subcats)
 
 
+# Missing columns are reindexed to NaN: the total sums to 0.0 and no
+# sub-category group survives groupby's dropna.
+_SUMMARY_COLUMNS = ["sub_category", "amount"]
+
+
+def _group_summaries(
+    combined: pd.DataFrame, groups: np.ndarray, n_groups: int
+) -> List[_MonthSummary]:
+    """Summarize each group of ``combined`` rows with one groupby per level.
+
+    ``groups`` labels every row with its group number in [0, n_groups).
+    """
+    amounts = combined["amount"]
+    totals = amounts.groupby(groups).sum().reindex(range(n_groups), fill_value=0.0).tolist()
+    by_sub = amounts.groupby([groups, combined["sub_category"]]).sum()
+    subcats = _ranked_sub_totals(by_sub)
+    return [
+        _MonthSummary(total=float(totals[i]), subcats=subcats.get((i,), []))
+        for i in range(n_groups)
+    ]
+
+
+def _month_summaries(
+    by_period: Dict[pd.Period, MonthlyReports],
+) -> Dict[pd.Period, _MonthSummary]:
+    """Aggregate every month's earnings with one groupby over all reports."""
+    summaries: Dict[pd.Period, _MonthSummary] = {}
+    periods: List[pd.Period] = []
+    frames: List[pd.DataFrame] = []
+    for period, mr in by_period.items():
+        if mr.earnings is None or mr.earnings.empty:
+            summaries[period] = _MonthSummary(total=0.0, subcats=[])
+            continue
+        periods.append(period)
+        frames.append(mr.earnings.reindex(columns=_SUMMARY_COLUMNS))
+    if not frames:
+        return summaries
+
+    combined = pd.concat(frames, ignore_index=True)
+    month_idx = np.repeat(np.arange(len(frames)), [len(f) for f in frames])
+    summaries.update(zip(periods, _group_summaries(combined, month_idx, len(frames))))
+    return summaries
+
+
 @dataclass(frozen=True)
 class EarningsRow:
     sub_category: str
@@ -34,7 +86,7 @@ class EarningsRow:
     diff_percent: Optional[float]
 
 
-class EarningsStatsController:
+class EarningsStatsController:  # pylint: disable=too-many-instance-attributes
     """Controller to compute Earnings page data from MonthlyReports.
 
     Pure Python (no Qt). Provides a simple API for the view to render:
@@ -65,10 +117,20 @@ class EarningsStatsController:
         self._by_period: Dict[pd.Period, MonthlyReports] = {
             mr.month: mr for mr in self._reports
         }
-        # Cache month aggregates
-        self._month_cache: Dict[pd.Period, _MonthSummary] = {}
+        # Month aggregates for every report, computed up front in one pass
+        self._month_cache: Dict[pd.Period, _MonthSummary] = _month_summaries(self._by_period)
+        # Year -> its periods in order, for the yearly API
+        self._periods_by_year: Dict[int, List[pd.Period]] = {}
+        for period in sorted(self._by_period):
+            self._periods_by_year.setdefault(int(period.year), []).append(period)
         # Cache year aggregates
         self._year_cache: Dict[int, _YearSummary] = {}
+        # Every report with dated earnings, prepared for date-range queries
+        self._dated: List[_DatedFrame] = _dated_frames(
+            (mr.month, mr.earnings) for mr in self._reports
+        )
+        # Row positions per sub_category, built on first filter of a month
+        self._row_index = _RowIndex()
 
     # ---- Public API ----
     def available_months(self) -> List[pd.Period]:
@@ -77,13 +139,11 @@ class EarningsStatsController:
 
     def available_years(self) -> List[int]:
         """Return sorted list of years that have data."""
-        years = sorted({int(p.year) for p in self._by_period.keys()})
-        return years
+        return list(self._periods_by_year)
 
     @staticmethod
     def month_label(period: pd.Period) -> str:
-        names = _month_names()
-        return f"{names[int(period.month) - 1]} {int(period.year)}"
+        return _month_label(period)
 
     def total_for_month(self, period: pd.Period) -> float:
         return self._get_month_summary(period).total
@@ -98,6 +158,8 @@ class EarningsStatsController:
 
         Columns returned are those present in the underlying MonthlyReports.earnings
         (typically transaction_date, description, amount, from_account, sub_category).
+        An unfiltered month is a shallow copy that shares the report's data; copy it
+        before writing values in place.
         """
         mr = self._by_period.get(period)
         if mr is None:
@@ -113,11 +175,10 @@ class EarningsStatsController:
             ])
         if sub_category:
             if "sub_category" in df.columns:
-                df = df[df["sub_category"].fillna("") == sub_category]
-            else:
-                # If sub_category info is missing, no rows match this filter.
-                return pd.DataFrame(columns=df.columns)
-        return df.copy()
+                return df.take(self._row_index.positions(period, df["sub_category"], sub_category))
+            # If sub_category info is missing, no rows match this filter.
+            return pd.DataFrame(columns=df.columns)
+        return df.copy(deep=False)
 
     # ---- Yearly API ----
     def total_for_year(self, year: int) -> float:
@@ -170,71 +231,53 @@ class EarningsStatsController:
         sub_category: Optional[str] = None,
     ) -> pd.DataFrame:
         """Return all transactions for a year, optionally filtered by month/sub_category."""
-        frames = []
-        for period in self._by_period.keys():
-            if int(period.year) != year:
-                continue
+        parts = []
+        for period in self._periods_by_year.get(year, ()):
             if month is not None and period != month:
                 continue
             mr = self._by_period.get(period)
             if mr is None or mr.earnings is None or mr.earnings.empty:
                 continue
             df = mr.earnings
+            positions = None
             if sub_category and "sub_category" in df.columns:
-                df = df[df["sub_category"].fillna("") == sub_category]
-            frames.append(df)
+                positions = self._row_index.positions(period, df["sub_category"], sub_category)
+            parts.append((df, positions))
 
-        if not frames:
+        if not parts:
             return pd.DataFrame(columns=[
                 "transaction_date", "description", "amount",
                 "from_account", "sub_category",
             ])
-        return pd.concat(frames, ignore_index=True)
+        return _stack_rows(parts)
 
     # ---- Date Range API ----
     def total_for_range(self, start_date: date, end_date: date) -> float:
         """Return total earnings for the given date range."""
+        first, last = _day_number(start_date), _day_number(end_date)
         total = 0.0
-        for mr in self._reports:
-            if mr.earnings is None or mr.earnings.empty:
-                continue
-            df = mr.earnings
-            if "transaction_date" not in df.columns:
+        for entry in self._dated:
+            if entry.amount_sum is not None and entry.covered_by(first, last):
+                # Whole report lies inside the range: no row mask needed
+                total += entry.amount_sum
                 continue
-            mask = (df["transaction_date"].dt.date >= start_date) & (
-                df["transaction_date"].dt.date <= end_date
-            )
-            total += float(df.loc[mask, "amount"].sum())
+            mask = entry.range_mask(start_date, end_date)
+            total += float(np.nansum(entry.frame["amount"].to_numpy()[mask]))
         return total
 
     def subcategory_totals_for_range(
         self, start_date: date, end_date: date
     ) -> List[Tuple[str, float]]:
         """Return sub-category totals for the given date range."""
-        frames = []
-        for mr in self._reports:
-            if mr.earnings is None or mr.earnings.empty:
-                continue
-            df = mr.earnings
-            if "transaction_date" not in df.columns:
-                continue
-            mask = (df["transaction_date"].dt.date >= start_date) & (
-                df["transaction_date"].dt.date <= end_date
-            )
-            frames.append(df.loc[mask])
-
-        if not frames:
-            return []
-
-        combined = pd.concat(frames, ignore_index=True)
-        if "sub_category" not in combined.columns or combined.empty:
+        combined = _stack_masked_columns(
+            ((df, mask) for _, df, mask in self._in_range(start_date, end_date)),
+            _SUMMARY_COLUMNS,
+        )
+        if combined.empty:
             return []
-
-        grouped = combined.groupby("sub_category")["amount"].sum().sort_values(ascending=False)
-        return [
-            (str(idx) if idx else "(Uncategorized)", float(val))
-            for idx, val in grouped.items()
-        ]
+        # The whole range is one group
+        groups = np.zeros(len(combined), dtype=np.intp)
+        return _group_summaries(combined, groups, 1)[0].subcats
 
     def transactions_for_range(
         self,
@@ -243,28 +286,22 @@ class EarningsStatsController:
         sub_category: Optional[str] = None,
     ) -> pd.DataFrame:
         """Return all transactions within the date range, optionally filtered by sub_category."""
-        frames = []
-        for mr in self._reports:
-            if mr.earnings is None or mr.earnings.empty:
-                continue
-            df = mr.earnings
-            if "transaction_date" not in df.columns:
-                continue
-            mask = (df["transaction_date"].dt.date >= start_date) & (
-                df["transaction_date"].dt.date <= end_date
-            )
-            filtered = df.loc[mask]
-            if sub_category and "sub_category" in filtered.columns:
-                filtered = filtered[filtered["sub_category"].fillna("") == sub_category]
-            if not filtered.empty:
-                frames.append(filtered)
+        parts = []
+        for period, df, mask in self._in_range(start_date, end_date):
+            if sub_category and "sub_category" in df.columns:
+                positions = self._row_index.positions(period, df["sub_category"], sub_category)
+                positions = positions[mask[positions]]
+            else:
+                positions = np.flatnonzero(mask)
+            if len(positions):
+                parts.append((df, positions))
 
-        if not frames:
+        if not parts:
             return pd.DataFrame(columns=[
                 "transaction_date", "description", "amount",
                 "from_account", "sub_category",
             ])
-        return pd.concat(frames, ignore_index=True)
+        return _stack_rows(parts)
 
     # ---- Expected helpers ----
     def _expected_for_month(self, period: pd.Period) -> Dict[str, float]:
@@ -313,34 +350,18 @@ class EarningsStatsController:
         return rows, float(actual_total), float(expected_total)
 
     # ---- Internals ----
+    def _in_range(
+        self, start_date: date, end_date: date
+    ) -> Iterator[Tuple[pd.Period, pd.DataFrame, np.ndarray]]:
+        """Yield (period, frame, row mask) for each dated report, masked to the date range."""
+        for entry in self._dated:
+            yield entry.period, entry.frame, entry.range_mask(start_date, end_date)
+
     def _get_month_summary(self, period: pd.Period) -> _MonthSummary:
         cached = self._month_cache.get(period)
         if cached is not None:
             return cached
-
-        mr = self._by_period.get(period)
-        if mr is None or mr.earnings is None or mr.earnings.empty:
-            summary = _MonthSummary(total=0.0, subcats=[])
-            self._month_cache[period] = summary
-            return summary
-
-        df = mr.earnings
-        total_val = float(df["amount"].sum()) if "amount" in df.columns else 0.0
-
-        if "sub_category" in df.columns and not df.empty:
-            grouped = (
-                df.groupby("sub_category")["amount"].sum().sort_values(ascending=False)
-            )
-            subcats_list: List[Tuple[str, float]] = [
-                (str(idx) if idx else "(Uncategorized)", float(val))
-                for idx, val in grouped.items()
-            ]
-        else:
-            subcats_list = []
-
-        summary = _MonthSummary(total=total_val, subcats=subcats_list)
-        self._month_cache[period] = summary
-        return summary
+        return _MonthSummary(total=0.0, subcats=[])
 
     def _get_year_summary(self, year: int) -> _YearSummary:
         """Compute and cache yearly summary with month breakdown."""
@@ -348,19 +369,18 @@ class EarningsStatsController:
         if cached is not None:
             return cached
 
-        year_total = 0.0
-        months_data: List[Tuple[pd.Period, float, List[Tuple[str, float]]]] = []
-
-        # Get all periods for this year, sorted
-        year_periods = sorted(
-            [p for p in self._by_period.keys() if int(p.year) == year]
+        month_summaries = [
+            (period, self._get_month_summary(period))
+            for period in self._periods_by_year.get(year, ())
+        ]
+        # Sub-category lists are copied once here, so year_breakdown callers
+        # cannot reach the month cache
+        months_data: List[Tuple[pd.Period, float, List[Tuple[str, float]]]] = [
+            (period, month.total, list(month.subcats)) for period, month in month_summaries
+        ]
+        summary = _YearSummary(
+            total=sum((month.total for _, month in month_summaries), 0.0),
+            months=months_data,
         )
-
-        for period in year_periods:
-            month_summary = self._get_month_summary(period)
-            year_total += month_summary.total
-            months_data.append((period, month_summary.total, list(month_summary.subcats)))
-
-        summary = _YearSummary(total=year_total, months=months_data)
         self._year_cache[year] = summary
         return summary
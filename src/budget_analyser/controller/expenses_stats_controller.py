@@ -3,12 +3,20 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from budget_analyser.controller.controllers import MonthlyReports
-from .utils import month_names as _month_names
+from .utils import DatedFrame as _DatedFrame
+from .utils import RowIndex as _RowIndex
+from .utils import dated_frames as _dated_frames
+from .utils import day_number as _day_number
+from .utils import month_label as _month_label
+from .utils import ranked_sub_totals as _ranked_sub_totals
+from .utils import stack_rows as _stack_rows
+from .utils import stack_masked_columns as _stack_masked_columns
 
 
 @dataclass(frozen=True)
@@ -25,7 +33,78 @@ class _YearSummary:
     months: List[Tuple[pd.Period, float, List[Tuple[str, float, List[Tuple[str, float]]]]]]
 
 
-class ExpensesStatsController:
+_AGGREGATE_COLUMNS = ["category", "sub_category", "amount"]
+
+
+def _group_aggregates(
+    combined: pd.DataFrame, groups: np.ndarray, n_groups: int
+) -> Tuple[List[float], List[List[_CategoryNode]]]:
+    """Aggregate each group of ``combined`` rows with one groupby per level.
+
+    ``groups`` labels every row with its group number in [0, n_groups).
+    Returns (positive totals, category nodes) per group.
+    """
+    # Positive for display
+    amounts = -combined["amount"]
+    totals = amounts.groupby(groups).sum().reindex(range(n_groups), fill_value=0.0).tolist()
+    by_cat = amounts.groupby([groups, combined["category"]]).sum()
+    # Sub-categories are keyed on the filled category, as the "" filter matches NaN
+    by_sub = amounts.groupby(
+        [groups, combined["category"].fillna(""), combined["sub_category"]]
+    ).sum()
+
+    subcats_by_key = _ranked_sub_totals(by_sub)
+    cats_by_group = _ranked_sub_totals(by_cat)
+    nodes = [
+        [
+            _CategoryNode(
+                name=cat_name,
+                total=total,
+                subcats=subcats_by_key.get(
+                    (group, "" if cat_name == "(Uncategorized)" else cat_name), []
+                ),
+            )
+            for cat_name, total in cats_by_group.get((group,), [])
+        ]
+        for group in range(n_groups)
+    ]
+    return totals, nodes
+
+
+def _month_aggregates(
+    by_period: Dict[pd.Period, MonthlyReports],
+) -> Tuple[Dict[pd.Period, float], Dict[pd.Period, List[_CategoryNode]]]:
+    """Aggregate every month's expenses with one groupby per level over all reports.
+
+    Returns (positive month totals, category nodes per month).
+    """
+    totals: Dict[pd.Period, float] = {}
+    nodes: Dict[pd.Period, List[_CategoryNode]] = {}
+    periods: List[pd.Period] = []
+    frames: List[pd.DataFrame] = []
+    for period, mr in by_period.items():
+        if mr.expenses is None or mr.expenses.empty:
+            totals[period] = 0.0
+            nodes[period] = []
+            continue
+        periods.append(period)
+        frame = mr.expenses.reindex(columns=_AGGREGATE_COLUMNS)
+        if "category" not in mr.expenses.columns:
+            # Without a category column the whole month is one uncategorized node
+            frame["category"] = ""
+        frames.append(frame)
+    if not frames:
+        return totals, nodes
+
+    combined = pd.concat(frames, ignore_index=True)
+    month_idx = np.repeat(np.arange(len(frames)), [len(f) for f in frames])
+    month_totals, month_nodes = _group_aggregates(combined, month_idx, len(frames))
+    totals.update(zip(periods, month_totals))
+    nodes.update(zip(periods, month_nodes))
+    return totals, nodes
+
+
+class ExpensesStatsController:  # pylint: disable=too-many-instance-attributes
     """Controller to compute Expenses page data from MonthlyReports.
 
     Pure Python (no Qt). Provides a simple API for the view to render:
@@ -52,11 +131,22 @@ class ExpensesStatsController:
         self._logger = logger
         # Map Period("YYYY-MM") -> MonthlyReports for fast lookup
         self._by_period: Dict[pd.Period, MonthlyReports] = {mr.month: mr for mr in self._reports}
-        # Cache month aggregates
-        self._month_total_cache: Dict[pd.Period, float] = {}
-        self._category_cache: Dict[pd.Period, List[_CategoryNode]] = {}
+        # Month aggregates for every report, computed up front in one pass
+        month_totals, category_nodes = _month_aggregates(self._by_period)
+        self._month_total_cache: Dict[pd.Period, float] = month_totals
+        self._category_cache: Dict[pd.Period, List[_CategoryNode]] = category_nodes
+        # Year -> its periods in order, for the yearly API
+        self._periods_by_year: Dict[int, List[pd.Period]] = {}
+        for period in sorted(self._by_period):
+            self._periods_by_year.setdefault(int(period.year), []).append(period)
         # Cache year aggregates
         self._year_cache: Dict[int, _YearSummary] = {}
+        # Every report with dated expenses, prepared for date-range queries
+        self._dated: List[_DatedFrame] = _dated_frames(
+            (mr.month, mr.expenses) for mr in self._reports
+        )
+        # Row positions per (period, column) value, built on first filter of a month
+        self._row_index = _RowIndex()
 
     # ---- Public API ----
     def available_months(self) -> List[pd.Period]:
@@ -64,34 +154,19 @@ class ExpensesStatsController:
 
     def available_years(self) -> List[int]:
         """Return sorted list of years that have data."""
-        years = sorted({int(p.year) for p in self._by_period.keys()})
-        return years
+        return list(self._periods_by_year)
 
     @staticmethod
     def month_label(period: pd.Period) -> str:
-        names = _month_names()
-        return f"{names[int(period.month) - 1]} {int(period.year)}"
+        return _month_label(period)
 
     def total_for_month(self, period: pd.Period) -> float:
-        cached = self._month_total_cache.get(period)
-        if cached is not None:
-            return cached
-        mr = self._by_period.get(period)
-        if mr is None or mr.expenses is None or mr.expenses.empty:
-            self._month_total_cache[period] = 0.0
-            return 0.0
-        # Sum expenses as positive value for display
-        total = float((-mr.expenses["amount"]).sum()) if "amount" in mr.expenses.columns else 0.0
-        self._month_total_cache[period] = total
-        return total
+        return self._month_total_cache.get(period, 0.0)
 
     def category_breakdown(
         self, period: pd.Period
     ) -> List[Tuple[str, float, List[Tuple[str, float]]]]:
-        cached = self._category_cache.get(period)
-        if cached is None:
-            cached = self._compute_category_nodes(period)
-            self._category_cache[period] = cached
+        cached = self._category_cache.get(period, [])
         # Convert dataclass to tuple structure for consumers
         return [(n.name, n.total, list(n.subcats)) for n in cached]
 
@@ -104,7 +179,8 @@ class ExpensesStatsController:
     ) -> pd.DataFrame:
         """Return transactions for selected month filtered by category/sub-category.
 
-        Returns a copy of the underlying DataFrame. Amounts remain negative (raw data).
+        Amounts remain negative (raw data). An unfiltered month is a shallow copy that
+        shares the report's data; copy it before writing values in place.
         """
         mr = self._by_period.get(period)
         if mr is None:
@@ -119,18 +195,16 @@ class ExpensesStatsController:
                 "category",
                 "sub_category",
             ])
-        out = df
-        if category:
-            if "category" in out.columns:
-                out = out[out["category"].fillna("") == category]
-            else:
-                return pd.DataFrame(columns=df.columns)
-        if sub_category:
-            if "sub_category" in out.columns:
-                out = out[out["sub_category"].fillna("") == sub_category]
-            else:
-                return pd.DataFrame(columns=df.columns)
-        return out.copy()
+        if (category and "category" not in df.columns) or (
+            sub_category and "sub_category" not in df.columns
+        ):
+            return pd.DataFrame(columns=df.columns)
+        positions = self._filter_positions(
+            period, df, category=category, sub_category=sub_category
+        )
+        if positions is None:
+            return df.copy(deep=False)
+        return df.take(positions)
 
     # ---- Yearly API ----
     def total_for_year(self, year: int) -> float:
@@ -155,91 +229,57 @@ class ExpensesStatsController:
         sub_category: Optional[str] = None,
     ) -> pd.DataFrame:
         """Return all transactions for a year, optionally filtered."""
-        frames = []
-        for period in self._by_period.keys():
-            if int(period.year) != year:
-                continue
+        parts = []
+        for period in self._periods_by_year.get(year, ()):
             if month is not None and period != month:
                 continue
             mr = self._by_period.get(period)
             if mr is None or mr.expenses is None or mr.expenses.empty:
                 continue
             df = mr.expenses
-            if category and "category" in df.columns:
-                df = df[df["category"].fillna("") == category]
-            if sub_category and "sub_category" in df.columns:
-                df = df[df["sub_category"].fillna("") == sub_category]
-            if not df.empty:
-                frames.append(df)
-
-        if not frames:
+            positions = self._filter_positions(
+                period, df, category=category, sub_category=sub_category
+            )
+            if positions is None or len(positions):
+                parts.append((df, positions))
+
+        if not parts:
             return pd.DataFrame(columns=[
                 "transaction_date", "description", "amount",
                 "from_account", "category", "sub_category",
             ])
-        return pd.concat(frames, ignore_index=True)
+        return _stack_rows(parts)
 
     # ---- Date Range API ----
     def total_for_range(self, start_date: date, end_date: date) -> float:
         """Return total expenses for the given date range (as positive value)."""
+        first, last = _day_number(start_date), _day_number(end_date)
         total = 0.0
-        for mr in self._reports:
-            if mr.expenses is None or mr.expenses.empty:
-                continue
-            df = mr.expenses
-            if "transaction_date" not in df.columns:
+        # Convert to positive for display
+        for entry in self._dated:
+            if entry.amount_sum is not None and entry.covered_by(first, last):
+                # Whole report lies inside the range: no row mask needed
+                total -= entry.amount_sum
                 continue
-            mask = (df["transaction_date"].dt.date >= start_date) & (
-                df["transaction_date"].dt.date <= end_date
-            )
-            # Convert to positive for display
-            total += float((-df.loc[mask, "amount"]).sum())
+            mask = entry.range_mask(start_date, end_date)
+            total -= float(np.nansum(entry.frame["amount"].to_numpy()[mask]))
         return total
 
     def category_breakdown_for_range(
         self, start_date: date, end_date: date
     ) -> List[Tuple[str, float, List[Tuple[str, float]]]]:
         """Return category breakdown for the given date range."""
-        frames = []
-        for mr in self._reports:
-            if mr.expenses is None or mr.expenses.empty:
-                continue
-            df = mr.expenses
-            if "transaction_date" not in df.columns:
-                continue
-            mask = (df["transaction_date"].dt.date >= start_date) & (
-                df["transaction_date"].dt.date <= end_date
-            )
-            frames.append(df.loc[mask])
-
-        if not frames:
-            return []
-
-        combined = pd.concat(frames, ignore_index=True)
+        parts = [(df, mask) for _, df, mask in self._in_range(start_date, end_date)]
+        combined = _stack_masked_columns(parts, _AGGREGATE_COLUMNS)
         if combined.empty:
             return []
-
-        # Build category breakdown (same logic as _compute_category_nodes but for combined data)
-        result: List[Tuple[str, float, List[Tuple[str, float]]]] = []
-
-        if "category" in combined.columns:
-            cat_series = combined.groupby("category")["amount"].sum().sort_values()
-            cat_items = [
-                (str(cat) if cat else "(Uncategorized)", float(-total))
-                for cat, total in cat_series.items()
-            ]
-            cat_items.sort(key=lambda x: x[1], reverse=True)
-        else:
-            fallback_total = (
-                float((-combined["amount"]).sum()) if "amount" in combined.columns else 0.0
-            )
-            cat_items = [("(Uncategorized)", fallback_total)]
-
-        for cat_name, cat_total in cat_items:
-            subcats_list = self._build_subcats_for_category(combined, cat_name)
-            result.append((cat_name, cat_total, subcats_list))
-
-        return result
+        if not any("category" in df.columns for df, _ in parts):
+            # Without any category column the range is one uncategorized node
+            combined["category"] = ""
+        # The whole range is one group
+        groups = np.zeros(len(combined), dtype=np.intp)
+        _, nodes = _group_aggregates(combined, groups, 1)
+        return [(n.name, n.total, list(n.subcats)) for n in nodes[0]]
 
     def transactions_for_range(
         self,
@@ -249,94 +289,56 @@ class ExpensesStatsController:
         sub_category: Optional[str] = None,
     ) -> pd.DataFrame:
         """Return all transactions within the date range, optionally filtered."""
-        frames = []
-        for mr in self._reports:
-            if mr.expenses is None or mr.expenses.empty:
-                continue
-            df = mr.expenses
-            if "transaction_date" not in df.columns:
-                continue
-            mask = (df["transaction_date"].dt.date >= start_date) & (
-                df["transaction_date"].dt.date <= end_date
+        parts = []
+        for period, df, mask in self._in_range(start_date, end_date):
+            positions = self._filter_positions(
+                period, df, category=category, sub_category=sub_category
             )
-            filtered = df.loc[mask]
-            if category and "category" in filtered.columns:
-                filtered = filtered[filtered["category"].fillna("") == category]
-            if sub_category and "sub_category" in filtered.columns:
-                filtered = filtered[filtered["sub_category"].fillna("") == sub_category]
-            if not filtered.empty:
-                frames.append(filtered)
-
-        if not frames:
+            if positions is None:
+                positions = np.flatnonzero(mask)
+            else:
+                positions = positions[mask[positions]]
+            if len(positions):
+                parts.append((df, positions))
+
+        if not parts:
             return pd.DataFrame(columns=[
                 "transaction_date", "description", "amount",
                 "from_account", "category", "sub_category",
             ])
-        return pd.concat(frames, ignore_index=True)
+        return _stack_rows(parts)
 
     # ---- Internals ----
-    def _build_subcats_for_category(
-        self, data: pd.DataFrame, cat_name: str
-    ) -> List[Tuple[str, float]]:
-        """Build subcategory breakdown for a given category from DataFrame."""
-        dcat = data
-        if "category" in data.columns:
-            cat_filter = "" if cat_name == "(Uncategorized)" else cat_name
-            dcat = data[data["category"].fillna("") == cat_filter]
-
-        if "sub_category" not in dcat.columns or dcat.empty:
-            return []
-
-        sub_series = dcat.groupby("sub_category")["amount"].sum().sort_values()
-        subcats_list = [
-            (str(sub) if sub else "(Uncategorized)", float(-val))
-            for sub, val in sub_series.items()
-        ]
-        subcats_list.sort(key=lambda x: x[1], reverse=True)
-        return subcats_list
-
-    def _compute_category_nodes(self, period: pd.Period) -> List[_CategoryNode]:
-        mr = self._by_period.get(period)
-        if mr is None or mr.expenses is None or mr.expenses.empty:
-            return []
-        df = mr.expenses
-        # Build category totals (positive for display)
-        if "category" in df.columns and not df.empty:
-            cat_series = df.groupby("category")["amount"].sum().sort_values()
-            # sort_values ascending since amounts negative; but we convert to positive for display
-            # We'll sort by positive totals descending for UI
-            cat_items = [
-                (str(cat) if cat else "(Uncategorized)", float(-total))
-                for cat, total in cat_series.items()
-            ]
-            cat_items.sort(key=lambda x: x[1], reverse=True)
-        else:
-            # No category column
-            fallback_total = (
-                float((-df["amount"]).sum()) if "amount" in df.columns else 0.0
-            )
-            cat_items = [("(Uncategorized)", fallback_total)]
-
-        nodes: list[_CategoryNode] = []
-        for cat_name, cat_total in cat_items:
-            # Build sub-category totals for this category
-            subcats_list: List[Tuple[str, float]] = []
-            dcat = df
-            if "category" in df.columns:
-                cat_filter = "" if cat_name == "(Uncategorized)" else cat_name
-                dcat = df[df["category"].fillna("") == cat_filter]
-
-            if "sub_category" in dcat.columns and not dcat.empty:
-                sub_series = dcat.groupby("sub_category")["amount"].sum().sort_values()
-                subcats_list = [
-                    (str(sub) if sub else "(Uncategorized)", float(-val))
-                    for sub, val in sub_series.items()
-                ]
-                subcats_list.sort(key=lambda x: x[1], reverse=True)
+    def _in_range(
+        self, start_date: date, end_date: date
+    ) -> Iterator[Tuple[pd.Period, pd.DataFrame, np.ndarray]]:
+        """Yield (period, frame, row mask) for each dated report, masked to the date range."""
+        for entry in self._dated:
+            yield entry.period, entry.frame, entry.range_mask(start_date, end_date)
 
-            nodes.append(_CategoryNode(name=cat_name, total=float(cat_total), subcats=subcats_list))
+    def _filter_positions(
+        self,
+        period: pd.Period,
+        df: pd.DataFrame,
+        *,
+        category: Optional[str] = None,
+        sub_category: Optional[str] = None,
+    ) -> Optional[np.ndarray]:
+        """Return sorted row positions matching the filters, or None when nothing filters.
 
-        return nodes
+        Filters are non-empty names, so missing values never match. A filter on a
+        column the frame lacks is skipped.
+        """
+        positions: Optional[np.ndarray] = None
+        for column, value in (("category", category), ("sub_category", sub_category)):
+            if not value or column not in df.columns:
+                continue
+            matches = self._row_index.positions((period, column), df[column], value)
+            if positions is None:
+                positions = matches
+            else:
+                positions = np.intersect1d(positions, matches, assume_unique=True)
+        return positions
 
     def _get_year_summary(self, year: int) -> _YearSummary:
         """Compute and cache yearly summary with month breakdown."""
@@ -344,24 +346,17 @@ class ExpensesStatsController:
         if cached is not None:
             return cached
 
-        year_total = 0.0
-        # Type: List of (period, month_total, category_breakdown)
+        # (period, month_total, category_breakdown); category_breakdown already
+        # returns copies, so callers cannot reach the month cache
         months_data: List[
             Tuple[pd.Period, float, List[Tuple[str, float, List[Tuple[str, float]]]]]
-        ] = []
-
-        # Get all periods for this year, sorted
-        year_periods = sorted(
-            [p for p in self._by_period.keys() if int(p.year) == year]
+        ] = [
+            (period, self.total_for_month(period), self.category_breakdown(period))
+            for period in self._periods_by_year.get(year, ())
+        ]
+        summary = _YearSummary(
+            total=sum((month_total for _, month_total, _ in months_data), 0.0),
+            months=months_data,
         )
-
-        for period in year_periods:
-            month_total = self.total_for_month(period)
-            year_total += month_total
-            # Get category breakdown for this month
-            cat_breakdown = self.category_breakdown(period)
-            months_data.append((period, month_total, cat_breakdown))
-
-        summary = _YearSummary(total=year_total, months=months_data)
         self._year_cache[year] = summary
         return summary
@@ -4,6 +4,7 @@ import logging
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from budget_analyser.controller.controllers import MonthlyReports
@@ -14,6 +15,19 @@ def _norm(s: str) -> str:
     return (s or "").strip().lower()
 
 
+def _unmapped_mask(sub_category: pd.Series) -> np.ndarray:
+    """Return a row mask of missing or blank sub-categories.
+
+    Blankness is checked once per distinct value rather than once per row.
+    """
+    codes, uniques = pd.factorize(sub_category)
+    blank = np.fromiter(
+        (not str(value).strip() for value in uniques), dtype=bool, count=len(uniques)
+    )
+    # Missing values factorize to -1, which picks the trailing True
+    return np.append(blank, True)[codes]
+
+
 @dataclass
 class MapperController:
     """Controller to manage description/sub-category/category mappings.
@@ -27,6 +41,13 @@ class MapperController:
     store: JsonCategoryMappingStore
     _desc_to_sub: Dict[str, List[str]] = field(default_factory=dict, init=False)
     _sub_to_cat: Dict[str, List[str]] = field(default_factory=dict, init=False)
+    # normalized description keyword -> owning sub-category, kept in step with _desc_to_sub
+    _owner: Dict[str, str] = field(default_factory=dict, init=False)
+    # id(transactions) -> (transactions, unmapped row mask); the frame is kept so the id
+    # cannot be reused by another frame while cached
+    _unmapped_masks: Dict[int, Tuple[pd.DataFrame, np.ndarray]] = field(
+        default_factory=dict, init=False
+    )
 
     def __post_init__(self) -> None:
         self.reload()
@@ -43,19 +64,16 @@ class MapperController:
             df = getattr(mr, "transactions", None)
             if df is None or df.empty:
                 continue
-            # Determine unmapped mask
-            if "sub_category" in df.columns:
-                mask = df["sub_category"].astype(str).map(_norm) == ""
-                dfi = df.loc[mask].copy()
-            else:
-                dfi = df.copy()
             # Keep only expected columns if present
             expected_cols = ["transaction_date", "description", "amount", "from_account"]
-            cols = [c for c in expected_cols if c in dfi.columns]
+            cols = [c for c in expected_cols if c in df.columns]
             if not cols:
                 continue
-            dfi = dfi[cols]
-            frames.append(dfi)
+            # Keep unmapped rows only
+            if "sub_category" in df.columns:
+                frames.append(df.loc[self._unmapped_rows(df), cols])
+            else:
+                frames.append(df[cols])
 
         if not frames:
             return pd.DataFrame(
@@ -74,6 +92,9 @@ class MapperController:
     def list_unmapped_descriptions(self) -> List[str]:
         """Return a stable-sorted list of unique transaction descriptions that
         do not currently map to any sub-category in the processed reports.
+
+        Descriptions that already exist as a keyword in the working mappings are
+        left out, since assigning them again would only raise a conflict.
         """
         seen: set[str] = set()
         out: List[str] = []
@@ -83,19 +104,20 @@ class MapperController:
                 continue
             if "description" not in df.columns:
                 continue
+            descriptions = df["description"].to_numpy()
             if "sub_category" in df.columns:
                 # Only descriptions with empty/NaN sub_category are considered unmapped
-                mask = df["sub_category"].astype(str).map(_norm) == ""
-                series = df.loc[mask, "description"].astype(str)
-            else:
-                # No sub_category column -> treat all as unmapped
-                series = df["description"].astype(str)
-            for desc in series:
-                key = desc.strip()
-                if key and key not in seen:
+                descriptions = descriptions[self._unmapped_rows(df)]
+            # No sub_category column -> treat all as unmapped.
+            # Strip each distinct description once rather than once per row.
+            for desc in pd.unique(descriptions):
+                key = str(desc).strip()
+                # Descriptions already saved as keywords are mapped on the next rebuild
+                if key and key not in seen and _norm(key) not in self._owner:
                     seen.add(key)
                     out.append(key)
-        out.sort(key=lambda s: s.lower())
+        # Python computes each sort key once, so this is a single lower() per entry
+        out.sort(key=str.lower)
         return out
 
     def list_sub_categories(self) -> List[str]:
@@ -118,12 +140,6 @@ class MapperController:
         if sub_category not in self._desc_to_sub:
             raise ValueError(f"Unknown sub-category: {sub_category}")
 
-        # Build reverse index for conflict detection
-        owner: Dict[str, str] = {}
-        for sc, keywords in self._desc_to_sub.items():
-            for kw in keywords or []:
-                owner[_norm(kw)] = sc
-
         to_add: List[str] = []
         conflicts: List[Tuple[str, str]] = []
         for d in descriptions:
@@ -131,7 +147,7 @@ class MapperController:
             if not d_clean:
                 continue
             dn = _norm(d_clean)
-            exists_owner = owner.get(dn)
+            exists_owner = self._owner.get(dn)
             if exists_owner is not None:
                 conflicts.append((d_clean, exists_owner))
             else:
@@ -146,6 +162,8 @@ class MapperController:
         if not to_add:
             return
         self._desc_to_sub[sub_category] = list((self._desc_to_sub.get(sub_category) or [])) + to_add
+        for d in to_add:
+            self._owner[_norm(d)] = sub_category
         try:
             self.logger.info(
                 "Mapper: added %d descriptions to sub-category '%s'", len(to_add), sub_category
@@ -186,3 +204,17 @@ class MapperController:
     def reload(self) -> None:
         self._desc_to_sub = self.store.load_desc_to_sub()
         self._sub_to_cat = self.store.load_sub_to_cat()
+        self._owner = {
+            _norm(kw): sc for sc, keywords in self._desc_to_sub.items() for kw in keywords or []
+        }
+        self._unmapped_masks.clear()
+
+    # ----- Internals -----
+    def _unmapped_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """Return the memoized unmapped-row mask of a report's transactions."""
+        cached = self._unmapped_masks.get(id(df))
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        mask = _unmapped_mask(df["sub_category"])
+        self._unmapped_masks[id(df)] = (df, mask)
+        return mask
@@ -7,7 +7,7 @@ from typing import Dict, List
 import pandas as pd
 
 from budget_analyser.controller.controllers import MonthlyReports
-from .utils import month_names as _month_names
+from .utils import month_label as _month_label
 
 
 @dataclass(frozen=True)
@@ -42,8 +42,7 @@ class PaymentsReconciliationController:
 
     @staticmethod
     def month_label(period: pd.Period) -> str:
-        names = _month_names()
-        return f"{names[int(period.month) - 1]} {int(period.year)}"
+        return _month_label(period)
 
     def data(self, period: pd.Period) -> PaymentsReconciliationSummary:
         """Return the reconciliation data for a given month.
@@ -85,8 +84,9 @@ class PaymentsReconciliationController:
                 difference=0.0,
             )
 
-        pm = df[df["sub_category"].fillna("") == self.SUB_PAYMENTS].copy()
-        pc = df[df["sub_category"].fillna("") == self.SUB_CONFIRM].copy()
+        # NaN compares unequal, so missing sub-categories never match
+        pm = df[df["sub_category"] == self.SUB_PAYMENTS].copy()
+        pc = df[df["sub_category"] == self.SUB_CONFIRM].copy()
 
         # Sort by date desc for readability if column exists
         for sub_df in (pm, pc):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import List
 
+from budget_analyser.logging_setup import configure as configure_logging
 from budget_analyser.settings.preferences import AppPreferences
 
 
@@ -31,7 +32,7 @@ class SettingsController:
             raise ValueError(f"Invalid log level: {level}")
         self._prefs.set_log_level(level)
         # Apply immediately to the provided logger
-        self._logger.setLevel(getattr(logging, level))
+        configure_logging(self._logger, level, strict=True)
         self._logger.info("Log level changed to %s via SettingsController", level)
 
     # --- Password ---
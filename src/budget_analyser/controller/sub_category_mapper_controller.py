@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Set
 
 from budget_analyser.domain.errors import DataSourceError
 
@@ -34,6 +34,8 @@ class SubCategoryMapperController:
         self._store = store
         self._logger = logger
         self._mapping: Dict[str, List[str]] = {}
+        # lower-cased sub-category -> categories listing it, kept in step with _mapping
+        self._owners: Dict[str, Set[str]] = {}
         self.reload()
 
     # ---- Queries ----
@@ -55,15 +57,17 @@ class SubCategoryMapperController:
         if not cat:
             raise ValueError("Category name is required")
 
+        key = sub.lower()
+        owners = self._owners.setdefault(key, set())
         # Remove from any other category to avoid duplicates across groups
-        for k, subs in self._mapping.items():
-            if k.lower() == cat.lower():
-                continue
-            self._mapping[k] = [s for s in subs if s.lower() != sub.lower()]
+        for k in [k for k in owners if k.lower() != cat.lower()]:
+            self._mapping[k] = [s for s in self._mapping[k] if s.lower() != key]
+            owners.discard(k)
 
         target_list = self._mapping.setdefault(cat, [])
-        if sub.lower() not in {s.lower() for s in target_list}:
+        if cat not in owners:
             target_list.append(sub)
+            owners.add(cat)
 
     def move_sub_categories(self, sub_categories: Iterable[str], source: str, target: str) -> None:
         src = (source or "").strip()
@@ -81,10 +85,18 @@ class SubCategoryMapperController:
 
         # Remove from source
         self._mapping[src] = [s for s in self._mapping[src] if s.lower() not in move_set]
-
-        # Add to target, deduping while preserving order
-        combined = list(self._mapping[tgt]) + [s for s in sub_categories if str(s).strip()]
-        self._mapping[tgt] = _dedup_keep_order(combined)
+        for key in move_set:
+            self._owners.get(key, set()).discard(src)
+
+        # Add to target, deduping while preserving order; the owner index already
+        # knows which names the target holds, so its entries are not re-lowered
+        target_list = list(self._mapping[tgt])
+        for sub in _dedup_keep_order(sub_categories):
+            owners = self._owners.setdefault(sub.lower(), set())
+            if tgt not in owners:
+                target_list.append(sub)
+                owners.add(tgt)
+        self._mapping[tgt] = target_list
 
     def set_mapping(self, mapping: Dict[str, Iterable[str]]) -> None:
         normalized: Dict[str, List[str]] = {}
@@ -94,6 +106,10 @@ class SubCategoryMapperController:
                 continue
             normalized[c] = _dedup_keep_order(subs)
         self._mapping = normalized
+        self._owners = {}
+        for c, subs in normalized.items():
+            for s in subs:
+                self._owners.setdefault(s.lower(), set()).add(c)
 
     # ---- Persistence ----
     def save(self) -> None:
@@ -7,13 +7,13 @@ Single responsibility:
 
 from __future__ import annotations
 
+import csv
 import logging
+import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Tuple
-
-import pandas as pd
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set, Tuple
 
 from budget_analyser.infrastructure.ini_config import IniAppConfig
 
@@ -21,6 +21,13 @@ if TYPE_CHECKING:
     from budget_analyser.domain.transaction_ingestion import TransactionIngestionService
 
 
+# (account_type, INI section) for every kind of statement the app expects
+_ACCOUNT_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("credit", "credit_cards"),
+    ("debit", "checking_accounts"),
+)
+
+
 @dataclass(frozen=True)
 class UploadResult:
     """Result of an upload operation."""
@@ -70,33 +77,12 @@ class UploadController:
         Returns:
             List of tuples (bank_name, account_type, expected_filename) for missing files.
         """
-        missing: List[Tuple[str, str, str]] = []
-
-        # Check credit card statements
-        for bank in self.get_available_banks("credit"):
-            try:
-                filename = self._ini_config.get_statement_filename(
-                    section="credit_cards", account=bank
-                )
-                path = self._statements_dir / filename
-                if not path.exists():
-                    missing.append((bank, "credit", filename))
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                self._logger.warning("Error checking statement for %s: %s", bank, exc)
-
-        # Check checking account statements
-        for bank in self.get_available_banks("debit"):
-            try:
-                filename = self._ini_config.get_statement_filename(
-                    section="checking_accounts", account=bank
-                )
-                path = self._statements_dir / filename
-                if not path.exists():
-                    missing.append((bank, "debit", filename))
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                self._logger.warning("Error checking statement for %s: %s", bank, exc)
-
-        return missing
+        present = self._listed_statements()
+        return [
+            (bank, account_type, filename)
+            for bank, account_type, filename in self._expected_statements()
+            if filename is not None and not self._is_uploaded(filename, present)
+        ]
 
     def all_statements_present(self) -> bool:
         """Check if all required CSV statement files exist.
@@ -112,33 +98,43 @@ class UploadController:
         Returns:
             List of tuples (bank_name, account_type, is_uploaded) for all banks.
         """
-        status: List[Tuple[str, str, bool]] = []
+        present = self._listed_statements()
+        return [
+            (bank, account_type, filename is not None and self._is_uploaded(filename, present))
+            for bank, account_type, filename in self._expected_statements()
+        ]
 
-        # Check credit card statements
-        for bank in self.get_available_banks("credit"):
-            try:
-                filename = self._ini_config.get_statement_filename(
-                    section="credit_cards", account=bank
-                )
-                path = self._statements_dir / filename
-                status.append((bank, "credit", path.exists()))
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                self._logger.warning("Error checking statement for %s: %s", bank, exc)
-                status.append((bank, "credit", False))
+    def _expected_statements(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yield (bank_name, account_type, expected_filename) for every configured bank.
 
-        # Check checking account statements
-        for bank in self.get_available_banks("debit"):
-            try:
-                filename = self._ini_config.get_statement_filename(
-                    section="checking_accounts", account=bank
-                )
-                path = self._statements_dir / filename
-                status.append((bank, "debit", path.exists()))
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                self._logger.warning("Error checking statement for %s: %s", bank, exc)
-                status.append((bank, "debit", False))
+        The filename is None when it cannot be read from the configuration.
+        """
+        for account_type, section in _ACCOUNT_SECTIONS:
+            for bank in self.get_available_banks(account_type):
+                try:
+                    filename = self._ini_config.get_statement_filename(
+                        section=section, account=bank
+                    )
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    self._logger.warning("Error checking statement for %s: %s", bank, exc)
+                    filename = None
+                yield bank, account_type, filename
 
-        return status
+    def _listed_statements(self) -> Set[str]:
+        """Return the entry names of the statements folder, read in one directory scan."""
+        try:
+            with os.scandir(self._statements_dir) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
+    def _is_uploaded(self, filename: str, present: Set[str]) -> bool:
+        """Return True when the statement file exists in the statements folder.
+
+        Names missing from the listing are still checked on disk, which keeps
+        case-insensitive filesystems and nested filenames working.
+        """
+        return filename in present or (self._statements_dir / filename).exists()
 
     def get_expected_columns(self, bank_name: str) -> List[str]:
         """Return the expected source column names for a bank.
@@ -159,14 +155,22 @@ class UploadController:
             return []
 
     def _read_csv_columns(self, file_path: Path) -> Tuple[bool, str, List[str]]:
-        """Read CSV and return columns or error."""
+        """Read the CSV header and return its columns or an error.
+
+        Only the header and the first data row are parsed; blank lines are skipped.
+        """
         try:
-            df = pd.read_csv(file_path, nrows=5)
-            if df.empty:
-                return False, "CSV file is empty", []
-            return True, "", list(df.columns)
+            with file_path.open("r", newline="", encoding="utf-8-sig") as handle:
+                rows = (row for row in csv.reader(handle) if any(f.strip() for f in row))
+                header = next(rows, None)
+                first_row = next(rows, None)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             return False, f"Failed to read CSV: {exc}", []
+        if header is None:
+            return False, "Failed to read CSV: No columns to parse from file", []
+        if first_row is None:
+            return False, "CSV file is empty", []
+        return True, "", header
 
     def _check_missing_columns(
         self, csv_columns: List[str], expected_columns: List[str]
@@ -176,13 +180,11 @@ class UploadController:
         Special handling for 'amount' column: If the CSV has both 'Debit' and 'Credit'
         columns, the amount can be derived from them (as done in base_statement_formatter).
         """
-        csv_columns_lower = [c.lower() for c in csv_columns]
+        csv_columns_lower = {c.lower() for c in csv_columns}
         missing = []
 
         # Check if CSV has Debit+Credit (can derive amount from these)
-        has_debit_credit = (
-            "debit" in csv_columns_lower and "credit" in csv_columns_lower
-        )
+        has_debit_credit = {"debit", "credit"} <= csv_columns_lower
 
         for expected in expected_columns:
             expected_lower = expected.lower()
@@ -197,7 +199,7 @@ class UploadController:
 
         # If amount is expected but missing and no Debit+Credit, report it
         if "amount" not in csv_columns_lower and not has_debit_credit:
-            if "amount" in [e.lower() for e in expected_columns]:
+            if any(e.lower() == "amount" for e in expected_columns):
                 missing.append("Amount (or Debit+Credit)")
 
         return missing
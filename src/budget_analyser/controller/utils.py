@@ -1,6 +1,27 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+MONTH_NAMES: Tuple[str, ...] = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
 
 def month_names() -> List[str]:
@@ -8,17 +29,192 @@ def month_names() -> List[str]:
 
     Shared utility so all controllers/pages use the same labels.
     """
-    return [
-        "January",
-        "February",
-        "March",
-        "April",
-        "May",
-        "June",
-        "July",
-        "August",
-        "September",
-        "October",
-        "November",
-        "December",
-    ]
+    return list(MONTH_NAMES)
+
+
+def month_label(period: pd.Period) -> str:
+    """Return the display label for a monthly period, e.g. "January 2025"."""
+    return f"{MONTH_NAMES[period.month - 1]} {period.year}"
+
+
+def date_range_mask(dates: pd.Series, start_date: date, end_date: date) -> np.ndarray:
+    """Return a boolean mask of rows whose date falls within [start_date, end_date].
+
+    Compares the datetime64 values against day bounds directly instead of building
+    ``datetime.date`` objects per row. NaT never matches, as with ``.dt.date``.
+    """
+    values = dates.to_numpy()
+    if values.dtype.kind != "M":
+        # tz-aware or non-datetime64 storage: compare calendar dates as before
+        days = dates.dt.date
+        return ((days >= start_date) & (days <= end_date)).to_numpy(dtype=bool)
+    start = np.datetime64(start_date, "D")
+    end_exclusive = np.datetime64(end_date, "D") + np.timedelta64(1, "D")
+    return (values >= start) & (values < end_exclusive)
+
+
+def day_numbers(dates: pd.Series) -> Optional[np.ndarray]:
+    """Return each date as int64 days since the epoch, or None if not stored as datetime64.
+
+    NaT maps to the smallest int64, so it falls outside every day range.
+    """
+    values = dates.to_numpy()
+    if values.dtype.kind != "M":
+        return None
+    return values.astype("datetime64[D]").view("int64")
+
+
+def day_number(day: date) -> int:
+    """Return ``day`` as days since the epoch, comparable with day_numbers()."""
+    return int(np.datetime64(day, "D").astype("int64"))
+
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+class RowIndex:  # pylint: disable=too-few-public-methods
+    """Memoized row positions per value of a report column.
+
+    Each key (e.g. a month, or a month and column) is indexed with one groupby the
+    first time it is filtered, and later filters are dictionary lookups.
+    """
+
+    def __init__(self) -> None:
+        self._by_key: Dict[Hashable, Dict[str, np.ndarray]] = {}
+
+    def positions(self, key: Hashable, values: pd.Series, value: str) -> np.ndarray:
+        """Return the sorted row positions where ``values`` equals ``value``."""
+        index = self._by_key.get(key)
+        if index is None:
+            # Missing values drop out of the groupby; filters are non-empty names
+            index = values.groupby(values, sort=False).indices
+            self._by_key[key] = index
+        return index.get(value, _NO_ROWS)
+
+
+def ranked_sub_totals(by_sub: pd.Series) -> Dict[tuple, List[Tuple[str, float]]]:
+    """Bucket a groupby sum, whose last index level is sub_category, by its leading levels.
+
+    Within each bucket the largest totals come first and equal totals keep groupby's
+    name order. Blank names are labelled "(Uncategorized)".
+    """
+    values = by_sub.to_numpy()
+    codes = by_sub.index.codes
+    order = np.lexsort((-values, *reversed(codes[:-1])))
+    keys = by_sub.index.tolist()
+    buckets: Dict[tuple, List[Tuple[str, float]]] = {}
+    for i in order.tolist():
+        *key, sub = keys[i]
+        buckets.setdefault(tuple(key), []).append(
+            (str(sub) if sub else "(Uncategorized)", float(values[i]))
+        )
+    return buckets
+
+
+def stack_masked_columns(
+    parts: Iterable[Tuple[pd.DataFrame, np.ndarray]], columns: List[str]
+) -> pd.DataFrame:
+    """Stack the masked rows of ``columns`` from every (frame, mask) pair into one frame.
+
+    Gathers the column arrays directly instead of slicing and concatenating whole
+    frames. A column missing from a frame is NaN for that frame's rows.
+    """
+    gathered: List[List[np.ndarray]] = [[] for _ in columns]
+    for df, mask in parts:
+        n_rows = int(np.count_nonzero(mask))
+        for arrays, column in zip(gathered, columns):
+            if column in df.columns:
+                arrays.append(df[column].to_numpy()[mask])
+            else:
+                arrays.append(np.full(n_rows, np.nan, dtype=object))
+    return pd.DataFrame(
+        {
+            column: np.concatenate(arrays) if arrays else np.empty(0, dtype=object)
+            for column, arrays in zip(columns, gathered)
+        }
+    )
+
+
+def stack_rows(parts: List[Tuple[pd.DataFrame, Optional[np.ndarray]]]) -> pd.DataFrame:
+    """Row-concatenate the selected rows of every (frame, positions) pair into a new frame.
+
+    ``positions`` of None selects every row. When rows are selected from frames
+    sharing one schema of numpy dtypes, they are gathered column by column with
+    ``np.concatenate`` instead of taking and concatenating whole frames. Whole
+    frames, or anything else, go through ``pd.concat``. The result always has a
+    fresh RangeIndex.
+    """
+    columns = parts[0][0].columns
+    if all(positions is None for _, positions in parts) or not columns.is_unique or any(
+        not df.columns.equals(columns)
+        or not all(isinstance(dtype, np.dtype) for dtype in df.dtypes)
+        for df, _ in parts
+    ):
+        return pd.concat(
+            [df if positions is None else df.take(positions) for df, positions in parts],
+            ignore_index=True,
+        )
+
+    data = {}
+    for column in columns:
+        arrays = []
+        for df, positions in parts:
+            values = df[column].to_numpy()
+            arrays.append(values if positions is None else values[positions])
+        data[column] = np.concatenate(arrays)
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+@dataclass(frozen=True)
+class DatedFrame:
+    """A report frame prepared for date-range queries."""
+
+    period: pd.Period
+    frame: pd.DataFrame
+    # Row dates as day numbers; None when they are not plain datetime64
+    days: Optional[np.ndarray]
+    # Earliest and latest day number (NaT counts as earliest), or None without days
+    first_day: Optional[int]
+    last_day: Optional[int]
+    # NaN-skipping sum of a numeric amount column, or None otherwise
+    amount_sum: Optional[float]
+
+    def covered_by(self, first: int, last: int) -> bool:
+        """Return True when every row is known to fall within day numbers [first, last]."""
+        return (
+            self.first_day is not None
+            and self.last_day is not None
+            and first <= self.first_day
+            and self.last_day <= last
+        )
+
+    def range_mask(self, start_date: date, end_date: date) -> np.ndarray:
+        """Return the mask of rows dated within [start_date, end_date]."""
+        if self.days is None:
+            return date_range_mask(self.frame["transaction_date"], start_date, end_date)
+        return (self.days >= day_number(start_date)) & (self.days <= day_number(end_date))
+
+
+def dated_frames(items: Iterable[Tuple[pd.Period, Optional[pd.DataFrame]]]) -> List[DatedFrame]:
+    """Prepare every non-empty (period, frame) pair that has a transaction_date column."""
+    dated: List[DatedFrame] = []
+    for period, frame in items:
+        if frame is None or frame.empty or "transaction_date" not in frame.columns:
+            continue
+        days = day_numbers(frame["transaction_date"])
+        amount_sum = (
+            float(np.nansum(frame["amount"].to_numpy()))
+            if "amount" in frame.columns and pd.api.types.is_numeric_dtype(frame["amount"])
+            else None
+        )
+        dated.append(
+            DatedFrame(
+                period=period,
+                frame=frame,
+                days=days,
+                first_day=int(days.min()) if days is not None else None,
+                last_day=int(days.max()) if days is not None else None,
+                amount_sum=amount_sum,
+            )
+        )
+    return dated
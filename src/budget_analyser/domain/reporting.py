@@ -14,11 +14,22 @@ Steps:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Mapping
 
 import pandas as pd
 
 
+@dataclass(frozen=True)
+class ReportBundle:
+    """All report tables for one statement slice, built in a single call."""
+
+    earnings: pd.DataFrame
+    expenses: pd.DataFrame
+    expenses_category: pd.DataFrame
+    expenses_sub_category: pd.DataFrame
+
+
 class ReportService:
     """Service that creates report DataFrames from processed transactions."""
 
@@ -125,6 +136,40 @@ class ReportService:
             df["amount"] = -df["amount"].abs()
         return df
 
+    def build_all(
+        self, *, earnings_statement: pd.DataFrame, expenses_statement: pd.DataFrame
+    ) -> ReportBundle:
+        """Return every report table, filtering expenses only once.
+
+        Equivalent to calling `earnings`, `expenses`, `expenses_category` and
+        `expenses_sub_category` separately, but the two pivots reuse the
+        filtered expenses instead of re-filtering the statement each time.
+
+        Args:
+            earnings_statement: Rows eligible for the earnings report.
+            expenses_statement: Rows eligible for the expense reports
+                (must include category/sub_category/year_month).
+        """
+        expenses = self.expenses(statement=expenses_statement)
+        return ReportBundle(
+            earnings=self.earnings(statement=earnings_statement),
+            expenses=expenses,
+            expenses_category=self._pivot_expenses(expenses, index="category"),
+            expenses_sub_category=self._pivot_expenses(expenses, index="sub_category"),
+        )
+
+    @staticmethod
+    def _pivot_expenses(expenses: pd.DataFrame, *, index: str) -> pd.DataFrame:
+        """Pivot filtered expenses into `index` x month totals with margins."""
+        return expenses.pivot_table(
+            index=index,
+            columns="year_month",
+            values="amount",
+            aggfunc="sum",
+            margins=True,
+            margins_name="Total",
+        )
+
     def expenses_category(self, *, statement: pd.DataFrame) -> pd.DataFrame:
         """Return a pivot table of expenses aggregated by category and month.
 
@@ -137,14 +182,7 @@ class ReportService:
         # Filter to expenses only before pivoting.
         expenses = self.expenses(statement=statement)
         # Create a category x month pivot with totals.
-        return expenses.pivot_table(
-            index="category",
-            columns="year_month",
-            values="amount",
-            aggfunc="sum",
-            margins=True,
-            margins_name="Total",
-        )
+        return self._pivot_expenses(expenses, index="category")
 
     def expenses_sub_category(self, *, statement: pd.DataFrame) -> pd.DataFrame:
         """Return a pivot table of expenses aggregated by sub-category and month.
@@ -158,11 +196,4 @@ class ReportService:
         # Filter to expenses only before pivoting.
         expenses = self.expenses(statement=statement)
         # Create a sub-category x month pivot with totals.
-        return expenses.pivot_table(
-            index="sub_category",
-            columns="year_month",
-            values="amount",
-            aggfunc="sum",
-            margins=True,
-            margins_name="Total",
-        )
+        return self._pivot_expenses(expenses, index="sub_category")
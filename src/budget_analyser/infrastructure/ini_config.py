@@ -13,7 +13,7 @@ Notes:
 from __future__ import annotations
 
 import configparser
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Mapping
 
@@ -23,13 +23,32 @@ class IniAppConfig:
     """INI-backed configuration reader."""
 
     path: Path
+    # (mtime_ns, size) of the INI when it was last parsed -> parser; a mutable holder
+    # so the frozen instance can still cache
+    _cached: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
+
+    def _ini_signature(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def _parser(self) -> configparser.ConfigParser:
-        """Create and load a configparser for the configured INI file."""
+        """Return the parsed INI file, re-reading it only when it changed on disk."""
+        signature = self._ini_signature()
+        parser = self._cached.get(signature) if signature is not None else None
+        if parser is not None:
+            return parser
         # Disable interpolation to avoid treating values like "%(x)s" as templates.
         parser = configparser.ConfigParser(interpolation=None)
         # Load INI file content.
         parser.read(self.path, encoding="utf-8")
+        self._cached.clear()
+        if signature is not None:
+            self._cached[signature] = parser
         return parser
 
     def list_accounts(self, *, section: str) -> list[str]:
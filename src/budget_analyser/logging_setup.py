@@ -0,0 +1,44 @@
+"""Logging setup shared by the GUI composition root and controllers.
+
+Single responsibility:
+    Resolve log level names and apply them to application loggers.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import MappingProxyType
+from typing import Final, Mapping
+
+_LEVEL_MAP: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+    }
+)
+
+
+def resolve_level(level: str, *, strict: bool = False) -> int:
+    """Return the numeric level for a level name (case-insensitive).
+
+    Unknown names resolve to INFO, or raise ``ValueError`` when ``strict``.
+    """
+    resolved = _LEVEL_MAP.get(level.strip().upper())
+    if resolved is None:
+        if strict:
+            raise ValueError(f"Invalid log level: {level}")
+        return logging.INFO
+    return resolved
+
+
+def configure(logger: logging.Logger, level: str, *, strict: bool = False) -> None:
+    """Apply a level name to ``logger`` (see ``resolve_level`` for ``strict``).
+
+    The application loggers own their handlers, so propagation to the root
+    logger is disabled to skip the extra handler dispatch per record.
+    """
+    logger.setLevel(resolve_level(level, strict=strict))
+    logger.propagate = False
@@ -2,7 +2,9 @@
 
 Features supported:
   - Application log level (DEBUG/INFO/WARNING/ERROR/CRITICAL)
-  - Login password (stored as salted SHA‑256: "sha256$<salt_hex>$<hash_hex>")
+  - Login password (stored as a salted scrypt key:
+    "scrypt$<log2_n>$<r>$<p>$<salt_hex>$<key_hex>"; legacy salted SHA-256
+    values "sha256$<salt_hex>$<hash_hex>" are still accepted)
 
 Notes:
   - If no password is stored in the INI, the default password is "123456".
@@ -13,8 +15,9 @@ from __future__ import annotations
 
 import configparser
 import hashlib
+import hmac
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -27,23 +30,67 @@ DEFAULT_PASSWORD = "123456"
 DEFAULT_LOG_LEVEL = "DEBUG"
 DEFAULT_THEME = "dark"
 
+# scrypt cost parameters for new password hashes (N = 2**log2_n; ~16 MiB, tens of ms)
+SCRYPT_LOG2_N = 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
 
-def _hash_password_sha256(plain: str, *, salt: bytes | None = None) -> str:
-    """Return salted SHA-256 hash in the form: sha256$<salt_hex>$<hash_hex>.
+
+def _hash_password_scrypt(
+    plain: str,
+    *,
+    salt: bytes | None = None,
+    log2_n: int = SCRYPT_LOG2_N,
+    r: int = SCRYPT_R,
+    p: int = SCRYPT_P,
+) -> str:
+    """Return a salted scrypt key in the form: scrypt$<log2_n>$<r>$<p>$<salt_hex>$<key_hex>.
 
     If salt is not provided, a random 16-byte salt is generated.
     """
     if salt is None:
         salt = os.urandom(16)
-    h = hashlib.sha256()
-    h.update(salt)
-    h.update(plain.encode("utf-8"))
-    digest = h.hexdigest()
-    return f"sha256${salt.hex()}${digest}"
+    key = hashlib.scrypt(
+        plain.encode("utf-8"), salt=salt, n=2**log2_n, r=r, p=p, dklen=SCRYPT_DKLEN
+    )
+    return f"scrypt${log2_n}${r}${p}${salt.hex()}${key.hex()}"
+
+
+def _verify_password_scrypt(plain: str, stored: str) -> bool:
+    """Verify a password against a stored scrypt key string."""
+    try:
+        algo, log2_n, r, p, salt_hex, key_hex = stored.split("$", 5)
+        params = int(log2_n), int(r), int(p)
+        salt = bytes.fromhex(salt_hex)
+        expected = bytes.fromhex(key_hex)
+    except ValueError:
+        return False
+    if algo.lower() != "scrypt":
+        return False
+    try:
+        actual = hashlib.scrypt(
+            plain.encode("utf-8"),
+            salt=salt,
+            n=2 ** params[0],
+            r=params[1],
+            p=params[2],
+            dklen=len(expected),
+        )
+    except (ValueError, OverflowError, MemoryError):
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+def _verify_password(plain: str, stored: str) -> bool:
+    """Verify a password against a stored hash string of any supported scheme."""
+    if stored.lower().startswith("scrypt$"):
+        return _verify_password_scrypt(plain, stored)
+    return _verify_password_sha256(plain, stored)
 
 
 def _verify_password_sha256(plain: str, stored: str) -> bool:
-    """Verify a password against a stored salted SHA-256 hash string."""
+    """Verify a password against a legacy salted SHA-256 hash string."""
     try:
         algo, salt_hex, digest = stored.split("$", 2)
     except ValueError:
@@ -52,9 +99,57 @@ def _verify_password_sha256(plain: str, stored: str) -> bool:
         return False
     try:
         salt = bytes.fromhex(salt_hex)
+        expected = bytes.fromhex(digest)
     except ValueError:
         return False
-    return _hash_password_sha256(plain, salt=salt) == f"sha256${salt_hex}${digest}"
+    # Compare raw digests of the single salt+password buffer in constant time.
+    actual = hashlib.sha256(salt + plain.encode("utf-8")).digest()
+    return hmac.compare_digest(actual, expected)
+
+
+def _update_ini_key(path: Path, section: str, key: str, value: str) -> None:
+    """Set ``key = value`` under ``[section]`` rewriting only that line.
+
+    Unlike a ``ConfigParser`` round-trip, other sections, comments and layout
+    are preserved. The section/key are appended when missing. The file is
+    replaced atomically via a temporary sibling file.
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    new_line = f"{key} = {value}"
+    key_index: int | None = None
+    insert_at: int | None = None  # after the last setting of the section
+    for i, raw in enumerate(lines):
+        stripped = raw.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            if insert_at is not None:
+                break
+            if stripped[1:-1].strip() == section:
+                insert_at = i + 1
+            continue
+        if insert_at is None or not stripped or stripped.startswith(("#", ";")):
+            continue
+        name = stripped.replace(":", "=", 1).split("=", 1)[0].strip()
+        if name.lower() == key.lower():
+            key_index = i
+            break
+        insert_at = i + 1
+
+    if key_index is not None:
+        lines[key_index] = new_line
+    elif insert_at is not None:
+        lines.insert(insert_at, new_line)
+    else:
+        if lines and lines[-1].strip():
+            lines.append("")
+        lines.extend([f"[{section}]", new_line])
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 @dataclass
@@ -62,12 +157,35 @@ class AppPreferences:
     """INI-backed user/application preferences."""
 
     ini_path: Path
+    # (mtime_ns, size) of the INI when it was last parsed, and the parser
+    _cached: tuple[tuple[int, int] | None, configparser.ConfigParser | None] = field(
+        default=(None, None), init=False, repr=False, compare=False
+    )
+
+    def _ini_signature(self) -> tuple[int, int] | None:
+        try:
+            st = self.ini_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def _parser(self) -> configparser.ConfigParser:
+        """Return the parsed INI, re-reading it only when the file changed on disk."""
+        signature = self._ini_signature()
+        cached_signature, parser = self._cached
+        if parser is not None and signature is not None and signature == cached_signature:
+            return parser
         parser = configparser.ConfigParser(interpolation=None)
         parser.read(self.ini_path, encoding="utf-8")
+        self._cached = (signature, parser)
         return parser
 
+    def _write_key(self, key: str, value: str) -> None:
+        _update_ini_key(self.ini_path, APP_SECTION, key, value)
+        # A rewrite within the filesystem's timestamp granularity may keep the
+        # same signature, so drop the cached parser explicitly.
+        self._cached = (None, None)
+
     def get_log_level(self) -> str:
         parser = self._parser()
         level = parser.get(APP_SECTION, KEY_LOG_LEVEL, fallback=DEFAULT_LOG_LEVEL)
@@ -79,12 +197,7 @@ class AppPreferences:
         level_up = level.upper().strip()
         if level_up not in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}:
             raise ValueError(f"Invalid log level: {level}")
-        parser = self._parser()
-        if not parser.has_section(APP_SECTION):
-            parser.add_section(APP_SECTION)
-        parser.set(APP_SECTION, KEY_LOG_LEVEL, level_up)
-        with self.ini_path.open("w", encoding="utf-8") as f:
-            parser.write(f)
+        self._write_key(KEY_LOG_LEVEL, level_up)
 
     def get_password_hash(self) -> str | None:
         parser = self._parser()
@@ -96,19 +209,14 @@ class AppPreferences:
     def verify_password(self, plain: str) -> bool:
         stored = self.get_password_hash()
         if stored:
-            return _verify_password_sha256(plain, stored)
+            return _verify_password(plain, stored)
         # Fallback to default password when nothing is stored
         return plain == DEFAULT_PASSWORD
 
     def set_password(self, new_plain: str) -> None:
         """Persist new password hash to the INI."""
-        hashed = _hash_password_sha256(new_plain)
-        parser = self._parser()
-        if not parser.has_section(APP_SECTION):
-            parser.add_section(APP_SECTION)
-        parser.set(APP_SECTION, KEY_PASSWORD_HASH, hashed)
-        with self.ini_path.open("w", encoding="utf-8") as f:
-            parser.write(f)
+        hashed = _hash_password_scrypt(new_plain)
+        self._write_key(KEY_PASSWORD_HASH, hashed)
 
     # ---- Theme preferences ----
     def get_theme(self) -> str:
@@ -122,9 +230,4 @@ class AppPreferences:
         t = theme.strip().lower()
         if t not in {"dark", "light"}:
             raise ValueError(f"Invalid theme: {theme}")
-        parser = self._parser()
-        if not parser.has_section(APP_SECTION):
-            parser.add_section(APP_SECTION)
-        parser.set(APP_SECTION, KEY_THEME, t)
-        with self.ini_path.open("w", encoding="utf-8") as f:
-            parser.write(f)
+        self._write_key(KEY_THEME, t)
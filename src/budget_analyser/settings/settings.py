@@ -15,10 +15,12 @@ Steps:
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import os
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
 def _project_root() -> Path:
     """Return the project root directory.
 
@@ -32,6 +34,7 @@ def _project_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
+@functools.lru_cache(maxsize=None)
 def _package_root() -> Path:
     """Return the budget_analyser package root directory.
 
@@ -42,6 +45,7 @@ def _package_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@functools.lru_cache(maxsize=None)
 def _load_dotenv(dotenv_path: Path) -> None:
     """Load environment variables from a `.env` file into `os.environ`.
 
@@ -50,6 +54,7 @@ def _load_dotenv(dotenv_path: Path) -> None:
           it does not overwrite existing environment variables.
         - Lines starting with `#` are treated as comments.
         - Invalid lines are ignored.
+        - Each file is applied once per process (the call is memoized).
 
     Args:
         dotenv_path: Path to a `.env` file.
@@ -73,7 +78,7 @@ def _load_dotenv(dotenv_path: Path) -> None:
         # Clean up extracted key/value.
         key = key.strip()
         value = value.strip().strip('"').strip("'")
-        # Do not override an existing environment variable.
+        # Do not override an existing environment variable (so the first duplicate wins).
         os.environ.setdefault(key, value)
 
 
@@ -103,6 +108,18 @@ class Settings:
     log_level: str = "INFO"
 
 
+# Environment variables read by `load_settings` (also the memoization key).
+_ENV_VARS = (
+    "BUDGET_ANALYSER_STATEMENT_DIR",
+    "BUDGET_ANALYSER_INI_CONFIG_PATH",
+    "BUDGET_ANALYSER_DESCRIPTION_TO_SUB_CATEGORY_PATH",
+    "BUDGET_ANALYSER_SUB_CATEGORY_TO_CATEGORY_PATH",
+    "BUDGET_ANALYSER_CASHFLOW_TO_CATEGORY_PATH",
+    "BUDGET_ANALYSER_DATABASE_PATH",
+    "BUDGET_ANALYSER_LOG_LEVEL",
+)
+
+
 def load_settings() -> Settings:
     """Load application settings from environment (and optional `.env`).
 
@@ -114,6 +131,10 @@ def load_settings() -> Settings:
         2. Load `.env` if present.
         3. Read settings from environment, falling back to repo-local defaults.
 
+    The result is memoized on a snapshot of the environment variables below, so
+    repeated calls are cheap while still honouring environment changes. Call
+    `clear_settings_cache()` to drop the memoized values.
+
     Environment variables:
     - BUDGET_ANALYSER_STATEMENT_DIR
     - BUDGET_ANALYSER_INI_CONFIG_PATH
@@ -124,60 +145,74 @@ def load_settings() -> Settings:
     - BUDGET_ANALYSER_LOG_LEVEL
     """
     # Determine project root and apply `.env` overrides.
-    root = _project_root()
-    pkg_root = _package_root()
-    _load_dotenv(root / ".env")
+    _load_dotenv(_project_root() / ".env")
+
+    # Snapshot the relevant environment (unset variables are omitted).
+    env = tuple((name, os.environ[name]) for name in _ENV_VARS if name in os.environ)
+    return _settings_from_env(env)
+
+
+@functools.lru_cache(maxsize=1)
+def _settings_from_env(env: tuple[tuple[str, str], ...]) -> Settings:
+    """Build `Settings` from an environment snapshot, with repo-local defaults.
+
+    Args:
+        env: `(name, value)` pairs for the variables in `_ENV_VARS` that are set.
+    """
+    environ = dict(env)
+    # Defaults are joined as plain strings; each field becomes a `Path` exactly once.
+    data_dir = os.path.join(str(_package_root()), "data")
 
     # Read statement directory from env (default: `src/budget_analyser/data/statements`).
     statement_dir = Path(
-        os.environ.get(
+        environ.get(
             "BUDGET_ANALYSER_STATEMENT_DIR",
-            str(pkg_root / "data" / "statements"),
+            os.path.join(data_dir, "statements"),
         )
     )
 
     # Read INI config path from env.
     # Default: `src/budget_analyser/data/config/budget_analyser.ini`.
     ini_config_path = Path(
-        os.environ.get(
+        environ.get(
             "BUDGET_ANALYSER_INI_CONFIG_PATH",
-            str(pkg_root / "data" / "config" / "budget_analyser.ini"),
+            os.path.join(data_dir, "config", "budget_analyser.ini"),
         )
     )
 
     # Read JSON mapping paths from env.
     description_to_sub_category_path = Path(
-        os.environ.get(
+        environ.get(
             "BUDGET_ANALYSER_DESCRIPTION_TO_SUB_CATEGORY_PATH",
-            str(pkg_root / "data" / "mappers" / "description_to_sub_category.json"),
+            os.path.join(data_dir, "mappers", "description_to_sub_category.json"),
         )
     )
     sub_category_to_category_path = Path(
-        os.environ.get(
+        environ.get(
             "BUDGET_ANALYSER_SUB_CATEGORY_TO_CATEGORY_PATH",
-            str(pkg_root / "data" / "mappers" / "sub_category_to_category.json"),
+            os.path.join(data_dir, "mappers", "sub_category_to_category.json"),
         )
     )
 
     # Read cashflow mapping path from env.
     cashflow_to_category_path = Path(
-        os.environ.get(
+        environ.get(
             "BUDGET_ANALYSER_CASHFLOW_TO_CATEGORY_PATH",
-            str(pkg_root / "data" / "mappers" / "cashflow_to_category.json"),
+            os.path.join(data_dir, "mappers", "cashflow_to_category.json"),
         )
     )
 
     # Read database path from env.
     # Default: `src/budget_analyser/data/budget_analyser.db`.
     database_path = Path(
-        os.environ.get(
+        environ.get(
             "BUDGET_ANALYSER_DATABASE_PATH",
-            str(pkg_root / "data" / "budget_analyser.db"),
+            os.path.join(data_dir, "budget_analyser.db"),
         )
     )
 
     # Read log level (default: INFO).
-    log_level = os.environ.get("BUDGET_ANALYSER_LOG_LEVEL", "INFO")
+    log_level = environ.get("BUDGET_ANALYSER_LOG_LEVEL", "INFO")
 
     # Construct an immutable settings object.
     return Settings(
@@ -189,3 +224,14 @@ def load_settings() -> Settings:
         database_path=database_path,
         log_level=log_level,
     )
+
+
+def clear_settings_cache() -> None:
+    """Drop the memoized settings, `.env` loads and resolved root paths.
+
+    The next `load_settings()` call rereads `.env` and rebuilds `Settings`.
+    """
+    _settings_from_env.cache_clear()
+    _load_dotenv.cache_clear()
+    _project_root.cache_clear()
+    _package_root.cache_clear()
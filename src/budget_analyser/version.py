@@ -8,9 +8,6 @@ bundled VERSION file (for PyInstaller builds), or pyproject.toml.
 from __future__ import annotations
 
 import sys
-import subprocess
-from importlib.metadata import version as _get_pkg_version
-from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 
 # Application metadata
@@ -74,7 +71,12 @@ def get_version() -> str:
     if git_version:
         return git_version
 
-    # Try package metadata (works when installed)
+    # Try package metadata (works when installed); importlib.metadata pulls in the
+    # email package, so it is only imported when needed
+    # pylint: disable=import-outside-toplevel
+    from importlib.metadata import version as _get_pkg_version
+    from importlib.metadata import PackageNotFoundError
+
     try:
         return _get_pkg_version("budget-analyser")
     except PackageNotFoundError:
@@ -91,6 +93,8 @@ def _read_version_from_git() -> str | None:
         Version string without 'v' prefix, or None if not in a git repo
         or no tags exist.
     """
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     try:
         result = subprocess.run(
             ["git", "describe", "--tags", "--abbrev=0"],
@@ -194,5 +198,11 @@ def get_full_version_string() -> str:
     return f"{APP_NAME} v{get_version()}"
 
 
-# Module-level version for easy access
-__version__ = get_version()
+def __getattr__(name: str) -> str:
+    # Module-level version for easy access, resolved on first use: get_version()
+    # may shell out to git, which should not be paid just for importing the package
+    if name == "__version__":
+        value = get_version()
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,6 +21,7 @@ from logging.handlers import RotatingFileHandler
 
 from PySide6 import QtWidgets
 
+from budget_analyser.logging_setup import configure as configure_logging
 from budget_analyser.settings.settings import load_settings
 from budget_analyser.settings.preferences import AppPreferences
 from budget_analyser.domain.reporting import ReportService
@@ -124,11 +125,8 @@ def run_app() -> int:
     prefs = AppPreferences(settings.ini_config_path)
 
     logger = _ensure_logger()
-    # Apply persisted log level (defaults to INFO)
-    try:
-        logger.setLevel(getattr(logging, prefs.get_log_level()))
-    except Exception:  # safe guard; keep INFO if invalid
-        logger.setLevel(logging.INFO)
+    # Apply persisted log level (unknown names fall back to INFO)
+    configure_logging(logger, prefs.get_log_level())
     log_file = _logs_dir() / "gui_app.log"
     logger.info("Starting GUI application")
     # Startup diagnostics (single line per item to keep readable)
@@ -236,9 +236,17 @@ class SavingsPage(QtWidgets.QWidget):
         earnings_df = pd.concat(all_earnings, ignore_index=True) if all_earnings else pd.DataFrame()
         expenses_df = pd.concat(all_expenses, ignore_index=True) if all_expenses else pd.DataFrame()
 
-        # Calculate metrics
-        metrics = self._budget_controller.calculate_savings_metrics(earnings_df, expenses_df, year)
-        monthly_data = self._budget_controller.calculate_monthly_savings(earnings_df, expenses_df, year)
+        # Calculate metrics, parsing each frame's dates once for both calls
+        dates = (
+            self._budget_controller.parse_transaction_dates(earnings_df),
+            self._budget_controller.parse_transaction_dates(expenses_df),
+        )
+        metrics = self._budget_controller.calculate_savings_metrics(
+            earnings_df, expenses_df, year, dates=dates
+        )
+        monthly_data = self._budget_controller.calculate_monthly_savings(
+            earnings_df, expenses_df, year, dates=dates
+        )
 
         # Update summary cards
         self._update_card(self._earnings_card, f"${metrics.total_earnings:,.2f}")
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+
+from budget_analyser.controller import backend_controller
+from budget_analyser.controller.backend_controller import (
+    BackendController,
+    _fast_concat,
+    _payment_exclusion_masks,
+)
+from budget_analyser.domain.reporting import ReportService
+
+
+class _StubStatements:
+    def __init__(self, statements):
+        self._statements = statements
+
+    def get_statements(self):
+        return {name: df.copy() for name, df in self._statements.items()}
+
+
+class _StubColumnMappings:
+    def get_column_mapping(self, account_name):
+        return {"Date": "transaction_date", "Description": "description", "Amount": "amount"}
+
+
+class _StubCategoryMappings:
+    def description_to_sub_category(self):
+        return {
+            "salary": ["ACME PAYROLL"],
+            "groceries": ["MARKET"],
+            "payments_made": ["AUTOPAY"],
+            "payment_confirmations": ["PAYMENT THANK YOU"],
+        }
+
+    def sub_category_to_category(self):
+        return {
+            "Income": ["salary"],
+            "Needs": ["groceries"],
+            "payments_made": ["payments_made"],
+            "payment_confirmations": ["payment_confirmations"],
+        }
+
+
+def _controller(statements) -> BackendController:
+    return BackendController(
+        statement_repository=_StubStatements(statements),
+        column_mappings=_StubColumnMappings(),
+        category_mappings=_StubCategoryMappings(),
+        report_service=ReportService(),
+        logger=logging.getLogger(__name__),
+    )
+
+
+def _statements():
+    checking = pd.DataFrame(
+        {
+            "Date": ["2025-01-03", "2025-01-20", "2025-02-02"],
+            "Description": ["ACME PAYROLL", "AUTOPAY CARD", "ACME PAYROLL"],
+            "Amount": [3000.0, -500.0, 3100.0],
+        }
+    )
+    card = pd.DataFrame(
+        {
+            "Date": ["2025-01-05", "2025-01-21", "2025-02-10"],
+            "Description": ["MARKET 12", "PAYMENT THANK YOU", "MARKET 7"],
+            "Amount": [-80.0, 500.0, -45.5],
+        }
+    )
+    return {"checking": checking, "card": card}
+
+
+def test_run_builds_monthly_reports_with_payment_exclusions() -> None:
+    reports = _controller(_statements()).run()
+
+    assert [str(r.month) for r in reports] == ["2025-01", "2025-02"]
+    jan, feb = reports
+
+    # Full month kept for reconciliation, from both accounts
+    assert len(jan.transactions) == 4
+    assert set(jan.transactions["from_account"]) == {"checking", "card"}
+
+    # Payment confirmations never count as earnings; payments made never as expenses
+    assert jan.earnings["amount"].tolist() == [3000.0]
+    assert "payments_made" not in set(jan.expenses["sub_category"])
+    # Groceries plus the card-side payment confirmation (an expense category)
+    assert sorted(jan.expenses["amount"].tolist()) == [-500.0, -80.0]
+
+    assert feb.earnings["amount"].tolist() == [3100.0]
+    assert feb.expenses["amount"].tolist() == [-45.5]
+
+
+def test_run_iter_yields_months_in_order() -> None:
+    months = [str(r.month) for r in _controller(_statements()).run_iter()]
+
+    assert months == ["2025-01", "2025-02"]
+    assert list(_controller({}).run_iter()) == []
+
+
+def test_run_from_database_matches_run() -> None:
+    controller = _controller(_statements())
+    from_files = controller.run()
+
+    processed = pd.concat([r.transactions for r in from_files], ignore_index=True)
+    processed = processed.drop(columns=["year_month"])
+    processed["transaction_date"] = processed["transaction_date"].dt.strftime("%Y-%m-%d")
+    # Database rows arrive unordered and with arbitrary labels
+    processed = processed.iloc[::-1].set_axis([f"r{i}" for i in range(len(processed))])
+    from_db = controller.run_from_database(processed)
+
+    assert [r.month for r in from_db] == [r.month for r in from_files]
+    for db_report, file_report in zip(from_db, from_files):
+        assert sorted(db_report.earnings["amount"]) == sorted(file_report.earnings["amount"])
+        assert sorted(db_report.expenses["amount"]) == sorted(file_report.expenses["amount"])
+        assert len(db_report.transactions) == len(file_report.transactions)
+
+
+def test_run_from_database_accepts_typed_dates() -> None:
+    processed = pd.DataFrame(
+        {
+            "transaction_date": pd.to_datetime(["2025-03-31", "2025-04-01"]),
+            "description": ["ACME PAYROLL", "MARKET 3"],
+            "amount": [1000.0, -20.0],
+            "sub_category": ["salary", "groceries"],
+            "category": ["Income", "Needs"],
+        }
+    )
+    reports = _controller({}).run_from_database(processed)
+
+    assert [str(r.month) for r in reports] == ["2025-03", "2025-04"]
+    assert reports[0].earnings["amount"].tolist() == [1000.0]
+
+
+def test_run_without_statements_returns_no_reports() -> None:
+    assert _controller({}).run() == []
+
+
+def test_fast_concat_matches_pd_concat() -> None:
+    first = pd.DataFrame(
+        {"transaction_date": pd.to_datetime(["2025-01-03"]), "description": ["A"], "amount": [1]}
+    )
+    second = pd.DataFrame(
+        {"transaction_date": pd.to_datetime(["2025-02-04"]), "description": ["B"], "amount": [2.5]}
+    )
+    expected = pd.concat([first, second], ignore_index=True)
+
+    pd.testing.assert_frame_equal(_fast_concat([first, second]), expected)
+    assert _fast_concat([first]) is first
+    assert _fast_concat([expected.iloc[[1]]]).index.tolist() == [0]
+    reordered = second[["amount", "description", "transaction_date"]]
+    pd.testing.assert_frame_equal(
+        _fast_concat([first, reordered]), pd.concat([first, reordered], ignore_index=True)
+    )
+
+
+def test_payment_exclusion_masks_keep_missing_and_absent_labels() -> None:
+    frame = pd.DataFrame({"sub_category": ["payments_made", None, "salary", "payments_made"]})
+    not_confirmation, not_payment = _payment_exclusion_masks(frame)
+
+    assert not_confirmation.tolist() == [True, True, True, True]
+    assert not_payment.tolist() == [False, True, True, False]
+    assert _payment_exclusion_masks(frame.drop(columns=["sub_category"])) is None
+
+
+def test_unhashable_sub_categories_skip_exclusions_with_a_warning(caplog) -> None:
+    frame = pd.DataFrame(
+        {
+            "year_month": pd.PeriodIndex(["2025-01", "2025-01"], freq="M"),
+            "sub_category": [["payments_made"], "salary"],
+        }
+    )
+
+    with caplog.at_level(logging.WARNING):
+        tasks = list(_controller({})._month_tasks(frame))
+
+    _, group, earn_source, exp_source = tasks[0]
+    assert len(group) == len(earn_source) == len(exp_source) == 2
+    assert "skipping payments exclusions" in caplog.text
+
+
+def test_run_iter_slices_months_as_they_are_consumed(monkeypatch) -> None:
+    monkeypatch.setattr(backend_controller.os, "cpu_count", lambda: 1)
+    statements = {
+        "checking": pd.DataFrame(
+            {
+                "Date": ["2025-01-03", "2025-02-03", "2025-03-03", "2025-04-03"],
+                "Description": ["ACME PAYROLL"] * 4,
+                "Amount": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+    }
+    controller = _controller(statements)
+    sliced = []
+    month_tasks = controller._month_tasks
+
+    def counting_month_tasks(frame):
+        for task in month_tasks(frame):
+            sliced.append(str(task[0]))
+            yield task
+
+    monkeypatch.setattr(controller, "_month_tasks", counting_month_tasks)
+
+    reports = controller.run_iter()
+    assert str(next(reports).month) == "2025-01"
+    # One worker: the month handed out plus the one queued behind it
+    assert sliced == ["2025-01", "2025-02"]
+    assert [str(r.month) for r in reports] == ["2025-02", "2025-03", "2025-04"]
+    assert sliced == ["2025-01", "2025-02", "2025-03", "2025-04"]
@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import logging
 
-from budget_analyser.controller.budget_controller import BudgetController
-from budget_analyser.infrastructure.budget_database import EarningsGoal
+import pandas as pd
+import pytest
+
+from budget_analyser.controller.budget_controller import BudgetController, _transaction_dates
+from budget_analyser.infrastructure.budget_database import (
+    Account,
+    BudgetGoal,
+    EarningsGoal,
+    RecurringTransaction,
+)
 
 
 class _StubBudgetDB:
@@ -28,3 +36,224 @@ def test_get_earnings_goal_map_prefers_month_specific_over_all() -> None:
 
     assert jan_map == {"salary": 1200.0, "bonus": 200.0}
     assert feb_map == {"salary": 1000.0}
+
+
+def test_calculate_monthly_savings_totals_each_month() -> None:
+    controller = BudgetController(budget_db=_StubBudgetDB([]), logger=logging.getLogger(__name__))
+    earnings = pd.DataFrame(
+        {"transaction_date": ["2025-01-03", "2025-01-20", "2025-03-01", "2024-01-05"],
+         "amount": [1000.0, 500.0, 800.0, 999.0]}
+    )
+    expenses = pd.DataFrame(
+        {"transaction_date": ["2025-01-10", "2025-02-11", "not a date"],
+         "amount": [-300.0, -50.0, -7.0]}
+    )
+
+    rows = controller.calculate_monthly_savings(earnings, expenses, 2025)
+
+    assert len(rows) == 12
+    assert rows[0] == ("January", 1500.0, 300.0, 1200.0, 80.0)
+    assert rows[1] == ("February", 0.0, 50.0, -50.0, 0.0)
+    assert rows[2] == ("March", 800.0, 0.0, 800.0, 100.0)
+    assert rows[11] == ("December", 0.0, 0.0, 0.0, 0.0)
+    assert controller.calculate_monthly_savings(pd.DataFrame(), pd.DataFrame(), 2025)[0] == (
+        "January", 0.0, 0.0, 0.0, 0.0
+    )
+
+
+def test_calculate_budget_progress_uses_selected_month_only() -> None:
+    class _BudgetsDB(_StubBudgetDB):
+        def get_all_budget_goals(self):
+            return [
+                BudgetGoal(id=1, category="Needs", monthly_limit=100.0, year_month="ALL"),
+                BudgetGoal(id=2, category="Flexible", monthly_limit=50.0, year_month="2025-02"),
+            ]
+
+    controller = BudgetController(budget_db=_BudgetsDB([]), logger=logging.getLogger(__name__))
+    expenses = pd.DataFrame(
+        {
+            "transaction_date": ["2025-01-02", "2025-01-15", "2025-02-01"],
+            "category": ["Needs", "Needs", "Needs"],
+            "amount": [-60.0, -30.0, -500.0],
+            "description": ["a", "b", "c"],
+        }
+    )
+
+    progress = controller.calculate_budget_progress(expenses, "2025-01")
+
+    assert [(p.category, p.spent, p.status) for p in progress] == [("Needs", 90.0, "warning")]
+    assert list(expenses.columns) == ["transaction_date", "category", "amount", "description"]
+
+
+def test_check_recurring_anomalies_uses_latest_match_per_rule() -> None:
+    def _rule(rule_id, description, amount):
+        return RecurringTransaction(
+            id=rule_id, description=description, expected_amount=amount, frequency="monthly",
+            category="Flexible", sub_category="subscriptions", last_occurrence="2025-01-01",
+        )
+
+    class _RecurringDB(_StubBudgetDB):
+        def get_all_recurring_transactions(self, active_only=True):
+            return [_rule(1, "netflix", -15.0), _rule(2, "NETFLIX.COM", -20.0), _rule(3, "gym", -40)]
+
+    controller = BudgetController(budget_db=_RecurringDB([]), logger=logging.getLogger(__name__))
+    transactions = pd.DataFrame(
+        {
+            "transaction_date": pd.to_datetime(["2025-01-05", "2025-02-05", "2025-02-07"]),
+            "description": ["Netflix.com 123", "NETFLIX.COM 456", None],
+            "amount": [-15.0, -22.0, -99.0],
+        }
+    )
+
+    anomalies = controller.check_recurring_anomalies(transactions, tolerance_percent=5.0)
+
+    # Both overlapping rules see the newest Netflix charge; gym never matches
+    assert [(a["description"], a["actual"]) for a in anomalies] == [
+        ("netflix", 22.0),
+        ("NETFLIX.COM", 22.0),
+    ]
+    assert controller.check_recurring_anomalies(transactions.iloc[:0]) == []
+
+
+def test_get_recurring_summary_weights_frequencies() -> None:
+    rules = [
+        RecurringTransaction(None, "rent", -1200.0, "monthly", "Needs", "rent", "2025-01-01"),
+        RecurringTransaction(None, "gym", -10.0, "weekly", "Flexible", "gym", "2025-01-01"),
+        RecurringTransaction(None, "car", -300.0, "quarterly", "Needs", "car", "2025-01-01"),
+        RecurringTransaction(None, "domain", -24.0, "yearly", "Flexible", "web", "2025-01-01"),
+        RecurringTransaction(None, "odd", -999.0, "daily", "Flexible", "odd", "2025-01-01"),
+    ]
+
+    class _RecurringDB(_StubBudgetDB):
+        def get_all_recurring_transactions(self, active_only=True):
+            return rules
+
+    controller = BudgetController(budget_db=_RecurringDB([]), logger=logging.getLogger(__name__))
+    summary = controller.get_recurring_summary(pd.DataFrame())
+
+    assert summary["monthly_total"] == pytest.approx(1200.0 + 43.3 + 100.0 + 2.0)
+    assert summary["yearly_projection"] == pytest.approx(summary["monthly_total"] * 12)
+    assert summary["count"] == 5
+
+
+def test_calculate_savings_metrics_filters_year_and_counts_months() -> None:
+    controller = BudgetController(budget_db=_StubBudgetDB([]), logger=logging.getLogger(__name__))
+    earnings = pd.DataFrame(
+        {"transaction_date": ["2025-01-03", "2025-02-03", "2024-12-30"],
+         "amount": [1000.0, 1000.0, 5000.0]}
+    )
+    expenses = pd.DataFrame(
+        {"transaction_date": ["2025-01-10", "2025-03-11", "bad"], "amount": [-400.0, -100.0, -1.0]}
+    )
+
+    metrics = controller.calculate_savings_metrics(earnings, expenses, 2025)
+
+    assert (metrics.total_earnings, metrics.total_expenses) == (2000.0, 500.0)
+    assert metrics.savings_rate == 75.0
+    assert metrics.months_of_data == 3
+    assert metrics.monthly_average_savings == 500.0
+
+    overall = controller.calculate_savings_metrics(earnings, expenses)
+    assert overall.total_expenses == 501.0
+    assert overall.months_of_data == 4
+
+
+def test_get_net_worth_summary_buckets_by_account_type() -> None:
+    accounts = [
+        Account(1, "Checking", "checking", 1500.0, "2025-01-01"),
+        Account(2, "Joint", "checking", 500.0, "2025-01-01"),
+        Account(3, "Visa", "credit_card", -700.0, "2025-01-01"),
+        Account(4, "Mystery", "crypto", 99.0, "2025-01-01"),
+    ]
+
+    class _AccountsDB(_StubBudgetDB):
+        def get_all_accounts(self):
+            return accounts
+
+    summary = BudgetController(
+        budget_db=_AccountsDB([]), logger=logging.getLogger(__name__)
+    ).get_net_worth_summary()
+
+    assert summary.assets_by_type == {"checking": 2000.0}
+    assert summary.liabilities_by_type == {"credit_card": 700.0}
+    assert type(summary.assets_by_type) is dict
+    assert summary.net_worth == 1300.0
+
+
+def test_transaction_dates_follow_in_place_edits() -> None:
+    frame = pd.DataFrame({"transaction_date": ["2025-01-05", "2025-02-03"], "amount": [1.0, 2.0]})
+    assert _transaction_dates(frame)[0] == pd.Timestamp("2025-01-05")
+
+    frame.loc[0, "transaction_date"] = "2024-12-31"
+
+    assert _transaction_dates(frame)[0] == pd.Timestamp("2024-12-31")
+    assert _transaction_dates(frame.drop(columns=["transaction_date"])) is None
+
+
+def test_savings_methods_accept_pre_parsed_dates() -> None:
+    controller = BudgetController(budget_db=_StubBudgetDB([]), logger=logging.getLogger(__name__))
+    earnings = pd.DataFrame({"transaction_date": ["2025-01-03"], "amount": [1000.0]})
+    expenses = pd.DataFrame({"transaction_date": ["2025-02-10"], "amount": [-400.0]})
+    dates = (
+        controller.parse_transaction_dates(earnings),
+        controller.parse_transaction_dates(expenses),
+    )
+
+    assert controller.calculate_savings_metrics(
+        earnings, expenses, 2025, dates=dates
+    ) == controller.calculate_savings_metrics(earnings, expenses, 2025)
+    assert controller.calculate_monthly_savings(
+        earnings, expenses, 2025, dates=dates
+    ) == controller.calculate_monthly_savings(earnings, expenses, 2025)
+
+
+def test_check_recurring_anomalies_matches_descriptions_literally() -> None:
+    class _RecurringDB(_StubBudgetDB):
+        def get_all_recurring_transactions(self, active_only=True):
+            return [
+                RecurringTransaction(
+                    None, "SQ *COFFEE (1)", -5.0, "weekly", "Flexible", "coffee", "2025-01-01"
+                )
+            ]
+
+    controller = BudgetController(budget_db=_RecurringDB([]), logger=logging.getLogger(__name__))
+    transactions = pd.DataFrame(
+        {
+            "transaction_date": pd.to_datetime(["2025-01-05", "2025-01-06"]),
+            "description": ["sq *coffee (1) seattle", "SQ COFFEE 1"],
+            "amount": [-9.0, -50.0],
+        }
+    )
+
+    anomalies = controller.check_recurring_anomalies(transactions)
+
+    assert [(a["description"], a["actual"]) for a in anomalies] == [("SQ *COFFEE (1)", 9.0)]
+
+
+def test_list_reads_are_cached_until_a_write() -> None:
+    class _CountingDB(_StubBudgetDB):
+        def __init__(self):
+            super().__init__([])
+            self.reads = 0
+            self.budgets = [BudgetGoal(1, "Needs", 100.0, "ALL")]
+
+        def get_all_budget_goals(self):
+            self.reads += 1
+            return list(self.budgets)
+
+        def set_budget_goal(self, category, monthly_limit, year_month):
+            goal = BudgetGoal(len(self.budgets) + 1, category, monthly_limit, year_month)
+            self.budgets.append(goal)
+            return goal
+
+    db = _CountingDB()
+    controller = BudgetController(budget_db=db, logger=logging.getLogger(__name__))
+
+    controller.get_all_budgets().clear()  # callers get their own list
+    controller.calculate_budget_progress(pd.DataFrame(), "2025-01")
+    assert len(controller.get_all_budgets()) == 1
+    assert db.reads == 1
+
+    controller.set_budget("Flexible", 50.0)
+    assert [b.category for b in controller.get_all_budgets()] == ["Needs", "Flexible"]
+    assert db.reads == 2
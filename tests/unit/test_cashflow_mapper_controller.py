@@ -24,8 +24,9 @@ def test_set_mapping_dedup_and_expenses_win() -> None:
 
     controller.set_mapping(["Income", "Flexible", "Bonus", "Bonus"], ["Flexible", "Needs"])
 
-    assert controller.earnings_categories() == ["Income", "Bonus"]
-    assert controller.expense_categories() == ["Flexible", "Needs"]
+    assert controller.earnings_categories() == ("Income", "Bonus")
+    assert controller.expense_categories() == ("Flexible", "Needs")
+    assert controller.mapping()["Earnings"] is controller.earnings_categories()
 
 
 def test_move_and_save_persists_changes() -> None:
@@ -38,4 +39,14 @@ def test_move_and_save_persists_changes() -> None:
 
     assert store.saved is not None
     assert store.saved["Expenses"] == ["Needs", "Income", "Refunded_money"]
-    assert store.saved["Earnings"] == []
\ No newline at end of file
+    assert store.saved["Earnings"] == []
+
+
+def test_move_accepts_one_shot_iterators() -> None:
+    store = _StubStore({"Earnings": ["Income"], "Expenses": ["Needs", "Gifts"]})
+    controller = CashflowMapperController(store, logging.getLogger(__name__))
+
+    controller.move_to_earnings(c for c in ["gifts", " "])
+
+    assert controller.expense_categories() == ("Needs",)
+    assert controller.earnings_categories() == ("Income", "gifts")
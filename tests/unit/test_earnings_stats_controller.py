@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import date
 from typing import Dict
 
 import pandas as pd
@@ -87,4 +88,61 @@ def test_table_for_year_sums_expected_per_month() -> None:
     assert salary.actual == approx(150.0)
     assert salary.expected == approx(160.0)
     assert salary.diff == approx(-10.0)
-    assert salary.diff_percent == approx(-6.25)
\ No newline at end of file
+    assert salary.diff_percent == approx(-6.25)
+
+
+def test_range_queries_include_both_end_days() -> None:
+    earnings = pd.DataFrame(
+        {
+            "transaction_date": pd.to_datetime(
+                ["2024-12-31 23:59", "2025-01-01 00:00", "2025-01-31 23:59", "2025-02-01 00:00", None]
+            ),
+            "description": ["desc"] * 5,
+            "amount": [1.0, 10.0, 20.0, 100.0, 1000.0],
+            "from_account": ["acc"] * 5,
+            "sub_category": ["a", "salary", "bonus", "salary", "salary"],
+        }
+    )
+    report = MonthlyReports(
+        month=pd.Period("2025-01"),
+        earnings=earnings,
+        expenses=pd.DataFrame(),
+        expenses_category=pd.DataFrame(),
+        expenses_sub_category=pd.DataFrame(),
+        transactions=earnings,
+    )
+    ctrl = EarningsStatsController([report], logging.getLogger(__name__))
+    start, end = date(2025, 1, 1), date(2025, 1, 31)
+
+    assert ctrl.total_for_range(start, end) == approx(30.0)
+    assert ctrl.subcategory_totals_for_range(start, end) == [("bonus", 20.0), ("salary", 10.0)]
+    assert list(ctrl.transactions_for_range(start, end, sub_category="bonus")["amount"]) == [20.0]
+
+
+def test_transactions_sub_category_filter_treats_missing_as_blank() -> None:
+    reports = [_monthly_report("2025-01", [1.0, 2.0, 3.0, 4.0], ["salary", None, "bonus", "salary"])]
+    ctrl = EarningsStatsController(reports, logging.getLogger(__name__))
+    period = pd.Period("2025-01")
+
+    assert list(ctrl.transactions(period, "salary")["amount"]) == [1.0, 4.0]
+    assert list(ctrl.transactions(period, "bonus")["amount"]) == [3.0]
+    assert ctrl.transactions(period, "rent").empty
+    assert len(ctrl.transactions(period)) == 4
+    assert list(ctrl.transactions_for_year(2025, sub_category="salary")["amount"]) == [1.0, 4.0]
+
+
+def test_yearly_api_uses_chronological_periods() -> None:
+    reports = [
+        _monthly_report("2025-02", [2.0], ["salary"]),
+        _monthly_report("2024-12", [9.0], ["salary"]),
+        _monthly_report("2025-01", [1.0], ["salary"]),
+    ]
+    ctrl = EarningsStatsController(reports, logging.getLogger(__name__))
+
+    assert ctrl.available_years() == [2024, 2025]
+    assert [period for period, _, _ in ctrl.year_breakdown(2025)] == [
+        pd.Period("2025-01"),
+        pd.Period("2025-02"),
+    ]
+    assert list(ctrl.transactions_for_year(2025)["amount"]) == [1.0, 2.0]
+    assert ctrl.total_for_year(2023) == 0.0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import date
+
 import pandas as pd
 
 from budget_analyser.controller import ExpensesStatsController
@@ -99,3 +101,93 @@ def test_transactions_filtering():
     groceries_tx = ctl.transactions(period, category="Food", sub_category="Groceries")
     assert len(groceries_tx) == 1
     assert groceries_tx.iloc[0]["description"].startswith("Groceries")
+
+
+def test_year_breakdown_keeps_months_separate():
+    reports = [
+        _mr(
+            "2025-01",
+            [
+                {"description": "Fuel", "amount": -60.0, "category": "Transport", "sub_category": "Fuel"},
+                {"description": "Dining", "amount": -30.0, "category": "Food", "sub_category": "Dining"},
+                {"description": "Misc", "amount": -5.0, "category": "", "sub_category": ""},
+            ],
+        ),
+        _mr("2025-02", []),
+        _mr(
+            "2025-03",
+            [{"description": "Groceries", "amount": -20.0, "category": "Food", "sub_category": "Groceries"}],
+        ),
+    ]
+    ctl = ExpensesStatsController(reports, _Logger())
+
+    assert ctl.year_breakdown(2025) == [
+        (
+            pd.Period("2025-01", freq="M"),
+            95.0,
+            [
+                ("Transport", 60.0, [("Fuel", 60.0)]),
+                ("Food", 30.0, [("Dining", 30.0)]),
+                ("(Uncategorized)", 5.0, [("(Uncategorized)", 5.0)]),
+            ],
+        ),
+        (pd.Period("2025-02", freq="M"), 0.0, []),
+        (pd.Period("2025-03", freq="M"), 20.0, [("Food", 20.0, [("Groceries", 20.0)])]),
+    ]
+    assert ctl.total_for_year(2025) == 115.0
+
+
+def test_category_breakdown_for_range_spans_months():
+    reports = [
+        _mr(
+            "2025-01",
+            [
+                {"description": "Fuel", "amount": -60.0, "category": "Transport", "sub_category": "Fuel"},
+                {"description": "Dining", "amount": -30.0, "category": "Food", "sub_category": "Dining"},
+            ],
+        ),
+        _mr(
+            "2025-02",
+            [
+                {"description": "Groceries", "amount": -50.0, "category": "Food", "sub_category": "Groceries"},
+                {"description": "Misc", "amount": -5.0, "category": None, "sub_category": None},
+            ],
+        ),
+        _mr(
+            "2025-03",
+            [{"description": "Fuel", "amount": -99.0, "category": "Transport", "sub_category": "Fuel"}],
+        ),
+    ]
+    ctl = ExpensesStatsController(reports, _Logger())
+
+    assert ctl.category_breakdown_for_range(date(2025, 1, 1), date(2025, 2, 28)) == [
+        ("Food", 80.0, [("Groceries", 50.0), ("Dining", 30.0)]),
+        ("Transport", 60.0, [("Fuel", 60.0)]),
+    ]
+    assert ctl.total_for_range(date(2025, 1, 1), date(2025, 2, 28)) == 145.0
+    assert ctl.category_breakdown_for_range(date(2026, 1, 1), date(2026, 1, 31)) == []
+
+
+def test_total_for_range_mixes_whole_and_partial_months():
+    reports = [
+        _mr(
+            "2025-01",
+            [
+                {"transaction_date": pd.Timestamp("2025-01-03"), "amount": -10.0},
+                {"transaction_date": pd.Timestamp("2025-01-30"), "amount": -20.0},
+            ],
+        ),
+        _mr(
+            "2025-02",
+            [
+                {"transaction_date": pd.Timestamp("2025-02-10"), "amount": -40.0},
+                {"transaction_date": pd.Timestamp("2025-02-20"), "amount": None},
+            ],
+        ),
+    ]
+    ctl = ExpensesStatsController(reports, _Logger())
+
+    assert ctl.total_for_range(date(2025, 1, 1), date(2025, 2, 28)) == 70.0
+    assert ctl.total_for_range(date(2025, 1, 3), date(2025, 2, 10)) == 70.0
+    assert ctl.total_for_range(date(2025, 1, 4), date(2025, 2, 28)) == 60.0
+    assert ctl.total_for_range(date(2025, 1, 1), date(2025, 2, 9)) == 30.0
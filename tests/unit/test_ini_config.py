@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from budget_analyser.infrastructure.ini_config import IniAppConfig
+
+
+def test_parsed_ini_is_reused_until_the_file_changes(tmp_path: Path) -> None:
+    ini = tmp_path / "budget_analyser.ini"
+    ini.write_text("[credit_cards]\nciti = citi.csv\n", encoding="utf-8")
+    config = IniAppConfig(path=ini)
+
+    assert config.list_accounts(section="credit_cards") == ["citi"]
+    parser = config._parser()
+    assert config._parser() is parser
+
+    ini.write_text("[credit_cards]\nciti = citi.csv\namex = amex.csv\n", encoding="utf-8")
+    st = ini.stat()
+    os.utime(ini, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert config.list_accounts(section="credit_cards") == ["citi", "amex"]
+    assert config.get_statement_filename(section="credit_cards", account="amex") == "amex.csv"
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from budget_analyser.logging_setup import configure, resolve_level
+
+
+def test_resolve_level_is_case_insensitive_and_defaults_to_info() -> None:
+    assert resolve_level("warning") == logging.WARNING
+    assert resolve_level(" Debug ") == logging.DEBUG
+    assert resolve_level("verbose") == logging.INFO
+
+    with pytest.raises(ValueError):
+        resolve_level("verbose", strict=True)
+
+
+def test_configure_sets_level_and_stops_propagation() -> None:
+    logger = logging.getLogger("budget_analyser.tests.logging_setup")
+    configure(logger, "error")
+    assert logger.level == logging.ERROR
+    assert logger.propagate is False
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from budget_analyser.controller.mapper_controller import MapperController
+from budget_analyser.controller.monthly_reports import MonthlyReports
+
+
+class _StubStore:
+    def __init__(self, desc_to_sub, sub_to_cat):
+        self.desc_to_sub = desc_to_sub
+        self.sub_to_cat = sub_to_cat
+
+    def load_desc_to_sub(self):
+        return self.desc_to_sub
+
+    def load_sub_to_cat(self):
+        return self.sub_to_cat
+
+    def save_desc_to_sub(self, mapping):
+        self.desc_to_sub = mapping
+
+    def save_sub_to_cat(self, mapping):
+        self.sub_to_cat = mapping
+
+
+def _report(period: str, transactions: pd.DataFrame) -> MonthlyReports:
+    empty = pd.DataFrame()
+    return MonthlyReports(
+        month=pd.Period(period, freq="M"),
+        earnings=empty,
+        expenses=empty,
+        expenses_category=empty,
+        expenses_sub_category=empty,
+        transactions=transactions,
+    )
+
+
+def _controller(reports: list[MonthlyReports]) -> MapperController:
+    store = _StubStore({"Groceries": ["Tesco"]}, {"Needs": ["Groceries"]})
+    return MapperController(reports, logging.getLogger(__name__), store)
+
+
+def test_unmapped_rows_include_blank_and_missing_sub_categories() -> None:
+    transactions = pd.DataFrame(
+        {
+            "transaction_date": pd.to_datetime(
+                ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-04", "2025-01-05"]
+            ),
+            "description": ["Tesco", "Cafe", "Cinema", "Kiosk", "Cafe"],
+            "amount": [-1.0, -2.0, -3.0, -4.0, -5.0],
+            "from_account": ["acc"] * 5,
+            "sub_category": ["Groceries", "", None, np.nan, "  "],
+        }
+    )
+    controller = _controller([_report("2025-01", transactions)])
+
+    unmapped = controller.list_unmapped_transactions()
+
+    assert list(unmapped["amount"]) == [-5.0, -4.0, -3.0, -2.0]
+    assert list(unmapped.columns) == ["transaction_date", "description", "amount", "from_account"]
+    assert controller.list_unmapped_descriptions() == ["Cafe", "Cinema", "Kiosk"]
+
+
+def test_frames_without_sub_category_are_fully_unmapped() -> None:
+    transactions = pd.DataFrame({"description": ["b", "A"], "amount": [-1.0, -2.0]})
+    controller = _controller([_report("2025-01", transactions)])
+
+    assert len(controller.list_unmapped_transactions()) == 2
+    assert controller.list_unmapped_descriptions() == ["A", "b"]
+
+
+def test_unmapped_masks_are_reused_until_reload() -> None:
+    transactions = pd.DataFrame({"description": ["a", "b"], "sub_category": ["", "Groceries"]})
+    controller = _controller([_report("2025-01", transactions)])
+
+    controller.list_unmapped_descriptions()
+    mask = controller._unmapped_masks[id(transactions)][1]
+    controller.list_unmapped_transactions()
+    assert controller._unmapped_masks[id(transactions)][1] is mask
+
+    controller.reload()
+    assert not controller._unmapped_masks
+
+
+def test_added_descriptions_conflict_with_later_adds() -> None:
+    controller = _controller([])
+    controller.create_sub_category("Dining", "Flexible")
+
+    controller.add_descriptions_to_sub_category("Dining", ["Cafe Nero"])
+
+    with pytest.raises(ValueError, match="'cafe nero' -> Dining"):
+        controller.add_descriptions_to_sub_category("Groceries", ["cafe nero"])
+    with pytest.raises(ValueError, match="'TESCO' -> Groceries"):
+        controller.add_descriptions_to_sub_category("Dining", ["TESCO"])
+    assert controller._desc_to_sub == {"Groceries": ["Tesco"], "Dining": ["Cafe Nero"]}
+
+
+def test_unmapped_descriptions_skip_existing_keywords() -> None:
+    transactions = pd.DataFrame(
+        {"description": ["Cafe", " tesco ", "Kiosk"], "sub_category": ["", "", None]}
+    )
+    controller = _controller([_report("2025-01", transactions)])
+    assert controller.list_unmapped_descriptions() == ["Cafe", "Kiosk"]
+
+    controller.add_descriptions_to_sub_category("Groceries", ["Kiosk"])
+
+    assert controller.list_unmapped_descriptions() == ["Cafe"]
+
+
+def test_all_missing_sub_categories_are_unmapped() -> None:
+    transactions = pd.DataFrame(
+        {"description": ["Cafe", "Kiosk"], "amount": [-1.0, -2.0], "sub_category": [np.nan, None]}
+    )
+    controller = _controller([_report("2025-01", transactions)])
+
+    assert list(controller.list_unmapped_transactions()["amount"]) == [-1.0, -2.0]
+    assert controller.list_unmapped_descriptions() == ["Cafe", "Kiosk"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 from budget_analyser.settings.preferences import AppPreferences, DEFAULT_LOG_LEVEL, DEFAULT_THEME
@@ -56,3 +57,47 @@ def test_theme_default_and_round_trip(tmp_path: Path) -> None:
     except ValueError:
         raised = True
     assert raised is True
+
+
+def test_password_hash_cache_tracks_external_ini_changes(tmp_path: Path) -> None:
+    ini = tmp_path / "budget_analyser.ini"
+    prefs = AppPreferences(ini)
+    prefs.set_password("first")
+    assert prefs.verify_password("first") is True
+
+    # Another instance (e.g. the settings page) changes the password on disk
+    AppPreferences(ini).set_password("second-password")
+    assert prefs.verify_password("second-password") is True
+    assert prefs.verify_password("first") is False
+
+
+def test_setters_only_touch_their_own_key(tmp_path: Path) -> None:
+    ini = tmp_path / "budget_analyser.ini"
+    ini.write_text(
+        "# statements\n[credit_cards]\nchase = chase_credit.csv\n\n[app]\nlog_level = INFO\n",
+        encoding="utf-8",
+    )
+    prefs = AppPreferences(ini)
+    prefs.set_log_level("error")
+    prefs.set_theme("light")
+
+    assert ini.read_text(encoding="utf-8") == (
+        "# statements\n[credit_cards]\nchase = chase_credit.csv\n\n"
+        "[app]\nlog_level = ERROR\ntheme = light\n"
+    )
+    assert prefs.get_log_level() == "ERROR"
+    assert prefs.get_theme() == "light"
+
+
+def test_password_stored_as_scrypt_and_legacy_sha256_accepted(tmp_path: Path) -> None:
+    ini = tmp_path / "budget_analyser.ini"
+    prefs = AppPreferences(ini)
+    prefs.set_password("kdf-pass")
+    assert (prefs.get_password_hash() or "").startswith("scrypt$14$8$1$")
+
+    # Hashes written by earlier versions (salted single-round SHA-256) still verify
+    salt = bytes.fromhex("00112233445566778899aabbccddeeff")
+    digest = hashlib.sha256(salt + b"old-pass").hexdigest()
+    ini.write_text(f"[app]\npassword_hash = sha256${salt.hex()}${digest}\n", encoding="utf-8")
+    assert prefs.verify_password("old-pass") is True
+    assert prefs.verify_password("kdf-pass") is False
@@ -85,3 +85,27 @@ def test_report_service_limits_earnings_and_offsets_refunds() -> None:
     # Expenses include negatives, mapped expense categories, and refund credits to offset totals
     assert list(exp["amount"]) == [-50.0, -40.0, 30.0, -25.0]
     assert (-exp["amount"]).sum() == 85.0
+
+
+def test_build_all_matches_individual_reports() -> None:
+    rs = ReportService()
+    df = pd.DataFrame(
+        {
+            "transaction_date": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
+            "description": ["Pay", "Shop", "Refund"],
+            "amount": [1000.0, -40.0, 15.0],
+            "from_account": ["acc", "acc", "acc"],
+            "category": ["Income", "Needs", "Refunded_money"],
+            "sub_category": ["salary", "groceries", "refund"],
+        }
+    )
+    df["year_month"] = df["transaction_date"].dt.to_period("M")
+
+    bundle = rs.build_all(earnings_statement=df, expenses_statement=df)
+
+    pd.testing.assert_frame_equal(bundle.earnings, rs.earnings(statement=df))
+    pd.testing.assert_frame_equal(bundle.expenses, rs.expenses(statement=df))
+    pd.testing.assert_frame_equal(bundle.expenses_category, rs.expenses_category(statement=df))
+    pd.testing.assert_frame_equal(
+        bundle.expenses_sub_category, rs.expenses_sub_category(statement=df)
+    )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from budget_analyser.settings.settings import _load_dotenv, clear_settings_cache, load_settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings_cache():
+    clear_settings_cache()
+    yield
+    clear_settings_cache()
+
+
+def test_dotenv_first_duplicate_key_wins(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BA_TEST_DUPLICATE", raising=False)
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("BA_TEST_DUPLICATE=first\nBA_TEST_DUPLICATE=second\n", encoding="utf-8")
+
+    _load_dotenv(dotenv)
+
+    assert os.environ["BA_TEST_DUPLICATE"] == "first"
+    monkeypatch.delenv("BA_TEST_DUPLICATE")
+
+
+def test_clear_settings_cache_rereads_dotenv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("BA_TEST_RELOAD", raising=False)
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("BA_TEST_RELOAD=old\n", encoding="utf-8")
+    _load_dotenv(dotenv)
+    monkeypatch.delenv("BA_TEST_RELOAD")
+    dotenv.write_text("BA_TEST_RELOAD=new\n", encoding="utf-8")
+
+    # Memoized: the file is not read again until the cache is cleared
+    _load_dotenv(dotenv)
+    assert "BA_TEST_RELOAD" not in os.environ
+
+    clear_settings_cache()
+    _load_dotenv(dotenv)
+    assert os.environ["BA_TEST_RELOAD"] == "new"
+    monkeypatch.delenv("BA_TEST_RELOAD")
+
+
+def test_load_settings_is_memoized_until_cleared() -> None:
+    settings = load_settings()
+    assert load_settings() is settings
+
+    clear_settings_cache()
+    reloaded = load_settings()
+    assert reloaded is not settings
+    assert reloaded == settings
@@ -50,4 +50,14 @@ def test_save_persists_mapping() -> None:
     controller.save()
 
     assert store.saved is not None
-    assert store.saved["Needs"] == ["Groceries", "Rent"]
\ No newline at end of file
+    assert store.saved["Needs"] == ["Groceries", "Rent"]
+
+
+def test_add_after_move_removes_from_new_owner_only() -> None:
+    store = _StubStore({"Needs": ["Groceries"], "Flexible": ["Travel"]})
+    controller = SubCategoryMapperController(store, logging.getLogger(__name__))
+
+    controller.move_sub_categories(["groceries"], "Needs", "Flexible")
+    controller.add_sub_category("GROCERIES", "Needs")
+
+    assert controller.mapping() == {"Needs": ["GROCERIES"], "Flexible": ["Travel"]}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from budget_analyser.controller.upload_controller import UploadController
+
+
+class _StubIniConfig:
+    def __init__(self, sections):
+        self.sections = sections
+
+    def list_accounts(self, *, section):
+        return list(self.sections[section])
+
+    def get_statement_filename(self, *, section, account):
+        filename = self.sections[section][account]
+        if filename is None:
+            raise KeyError(account)
+        return filename
+
+    def get_column_mapping(self, *, account_name):
+        return {"Date": "transaction_date", "Description": "description", "Amount": "amount"}
+
+
+def _controller(statements_dir: Path) -> UploadController:
+    config = _StubIniConfig(
+        {
+            "credit_cards": {"citi": "citi.csv", "amex": "amex.csv", "broken": None},
+            "checking_accounts": {"chase": "chase.csv"},
+        }
+    )
+    return UploadController(
+        logger=logging.getLogger(__name__), ini_config=config, statements_dir=statements_dir
+    )
+
+
+def test_upload_status_and_missing_statements(tmp_path: Path) -> None:
+    (tmp_path / "citi.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+    (tmp_path / "chase.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+    controller = _controller(tmp_path)
+
+    assert controller.get_bank_upload_status() == [
+        ("citi", "credit", True),
+        ("amex", "credit", False),
+        ("broken", "credit", False),
+        ("chase", "debit", True),
+    ]
+    assert controller.get_missing_statements() == [("amex", "credit", "amex.csv")]
+    assert controller.all_statements_present() is False
+
+
+def test_missing_statements_folder_reports_everything_missing(tmp_path: Path) -> None:
+    controller = _controller(tmp_path / "absent")
+
+    assert [uploaded for _, _, uploaded in controller.get_bank_upload_status()] == [False] * 4
+    assert len(controller.get_missing_statements()) == 3
+
+
+def test_validate_csv_reads_only_the_header(tmp_path: Path) -> None:
+    controller = _controller(tmp_path)
+    valid = tmp_path / "valid.csv"
+    valid.write_text(
+        "\ufeffDate,Description,Debit,Credit\n2025-01-01,Cafe,3.50,\n", encoding="utf-8"
+    )
+    header_only = tmp_path / "header_only.csv"
+    header_only.write_text("Date,Description,Amount\n\n", encoding="utf-8")
+    missing = tmp_path / "missing.csv"
+    missing.write_text("Date,Amount\n2025-01-01,1\n", encoding="utf-8")
+
+    assert controller.validate_csv(valid, "citi") == (True, "CSV format is valid", [])
+    assert controller.validate_csv(header_only, "citi") == (False, "CSV file is empty", [])
+    assert controller.validate_csv(missing, "citi")[2] == ["Description"]